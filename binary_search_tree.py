@@ -1,124 +1,432 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
+from contextlib import nullcontext
+from heapq import merge
+from mmap import mmap, ACCESS_READ
+from struct import Struct
 from typing import Any
+from threading import Lock
+import pickle
+import sys
 
 class Tree:
     class __Node:
-        def __init__(self, value: Any):
+        # Slots instead of a per-node __dict__ shrink each node by about a
+        # third, which dominates the memory of large trees
+        __slots__ = (
+            'value', 
+            'duplicates', 
+            'duplicate_count', 
+            'left', 
+            'right', 
+            'height', 
+            'size',
+        )
+
+        def __init__(self, value: Any, duplicates: list = None):
             """Initializes a new node with the specified value.
 
             Args:
                 value (Any): The value of the new node
+                duplicates (list, optional): The items equal to the value that
+                were inserted after it, in order of insertion. Defaults to 
+                None.
             """
             self.value = value
+
+            # Copies of a node share its list of duplicates, which is only
+            # ever appended to, and each sees the first duplicate_count items
+            self.duplicates = duplicates
+            self.duplicate_count = len(duplicates) if duplicates else 0
             self.left, self.right, = None, None
+            self.height = 1
+            self.size = self.count()
 
-        def min(self) -> Any:
-            """Returns the minimum item in the subtree.
+        def count(self) -> int:
+            """Returns the number of items held by the node.
 
             Returns:
-                Any: The minimum item in the subtree
+                int: The number of items equal to the value of the node
             """
-            min_item = self.value
-            if self.left:
-                min_item = self.left.min()
+            return self.duplicate_count + 1
 
-            return min_item
+        def items(self) -> list:
+            """Returns the items held by the node in order of insertion.
 
-        def max(self) -> Any:
-            """Returns the maximum item in the subtree.
+            Returns:
+                list: The items equal to the value of the node
+            """
+            if not self.duplicate_count:
+                return [self.value]
+
+            return [self.value, *self.duplicates[:self.duplicate_count]]
+
+        def copy(self):
+            """Returns a shallow copy of the node that shares its children and
+            its list of duplicates.
 
             Returns:
-                Any: The maximum item in the subtree
+                _Node: The copy of the node
+            """
+            node = self.__class__(self.value)
+            node.duplicates = self.duplicates
+            node.duplicate_count = self.duplicate_count
+            node.left, node.right = self.left, self.right
+            node.height, node.size = self.height, self.size
+
+            return node
+
+        def add_duplicate(self, value: Any):
+            """Appends an item equal to the value of the node. The shared
+            list of duplicates is appended to in place unless another copy of 
+            the node already appended past the items this node sees, in which 
+            case the visible items are copied into a new list.
+
+            Time complexity: Θ(1) amortized unless the list was already 
+            appended to by another copy
+
+            Args:
+                value (Any): The item to append
             """
-            max_item = self.value
-            if self.right:
-                max_item = self.right.max()
+            count = self.duplicate_count
+            if self.duplicates is None:
+                self.duplicates = [value]
+
+            else:
+                # Appending is atomic, so a writer that did not append right
+                # after the visible items copies them instead
+                self.duplicates.append(value)
+                if len(self.duplicates) != count + 1:
+                    self.duplicates = self.duplicates[:count] + [value]
 
-            return max_item
+            self.duplicate_count = count + 1
 
-        def add(self, value: Any):
-            """Inserts node into the subtree.
+        def pop_duplicate(self, shared: bool):
+            """Removes the most recently inserted duplicate.
 
             Args:
-                value (Any): The value of the node to be inserted
+                shared (bool): Whether other copies of the node may see the 
+                list of duplicates, which is then copied instead of shrunk
             """
-            # Value is inserted on the left branch
-            if value <= self.value:
-                if self.left:
-                    self.left.add(value)
+            count = self.duplicate_count - 1
+            if not count:
+                self.duplicates = None
 
-                else:
-                    self.left = self.__class__(value)
+            elif shared:
+                self.duplicates = self.duplicates[:count]
 
-            # Value is inserted on the right branch
             else:
-                if self.right:
-                    self.right.add(value)
+                self.duplicates.pop()
 
-                else:
-                    self.right = self.__class__(value)
+            self.duplicate_count = count
 
-        def values(self) -> list:
-            """Returns a list of of all the items in the subtree in sorted 
-            order.
+        def min(self) -> Any:
+            """Returns the minimum item in the subtree.
 
             Returns:
-                list: List of all the items in the subtree in sorted order
+                Any: The minimum item in the subtree
             """
-            left = self.left.values() if self.left else []
-            right = self.right.values() if self.right else []
+            node = self
+            while node.left:
+                node = node.left
+
+            return node.value
 
-            return [*left, self.value, *right]
+        def max(self) -> Any:
+            """Returns the maximum item in the subtree.
 
-        def __contains__(self, value: Any):
-            """Determines whether a value is in the subtree.
+            Returns:
+                Any: The maximum item in the subtree
+            """
+            node = self
+            while node.right:
+                node = node.right
 
-            Time complexity O(log(n))
+            return node.value
 
-            Args:
-                value (Any): The value to be searched for
+        def balance(self) -> int:
+            """Returns the difference between the heights of the left and 
+            right subtrees.
 
             Returns:
-                bool: Whether the value is in the subtree
+                int: The height of the left subtree minus the height of the
+                right subtree
             """
-            found = self.value == value
+            left = self.left.height if self.left else 0
+            right = self.right.height if self.right else 0
+
+            return left - right
 
-            if not found:
-                if value <= self.value:
-                    if self.left:
-                        found = self.left.__contains__(value)
+        def update(self):
+            """Recomputes the height and the size of the subtree from the
+            children of the node."""
+            left, right = self.left, self.right
 
-                elif self.right:
-                    found = self.right.__contains__(value)
+            self.height = max(
+                left.height if left else 0, 
+                right.height if right else 0
+            ) + 1
 
-            return found
+            self.size = (
+                (left.size if left else 0) 
+                + (right.size if right else 0) 
+                + self.count()
+            )
 
-        def __str__(self) -> str:
-            """Returns a string containing all the items of the subtree in
-            sorted order, delimited by a space.
+        def rotate_left(self):
+            """Rotates the subtree to the left so that the right child becomes
+            the root of the subtree.
 
             Returns:
-                str: All the items in the subtree in sorted order, delimited
-                by a space
+                _Node: The new root of the subtree
             """
-            left = self.left if self.left else ''
-            right = self.right if self.right else ''
+            pivot = self.right
+            self.right, pivot.left = pivot.left, self
 
-            return f'{left}{self.value} {right}'
+            self.update()
+            pivot.update()
+            return pivot
 
-    def __init__(self, items: list = None):
+        def rotate_right(self):
+            """Rotates the subtree to the right so that the left child becomes
+            the root of the subtree.
+
+            Returns:
+                _Node: The new root of the subtree
+            """
+            pivot = self.left
+            self.left, pivot.right = pivot.right, self
+
+            self.update()
+            pivot.update()
+            return pivot
+
+    def __init__(
+        self, 
+        items: list = None, 
+        balanced: bool = False, 
+        concurrent: bool = False
+    ):
         """Creates an empty tree.
 
         Args:
             items (list, optional): The list of items to populate the tree with.
             Defaults to None.
+            balanced (bool, optional): Whether the tree rebalances itself as an
+            AVL tree so that its height stays O(log(n)) regardless of the
+            order of insertion. Defaults to False.
+            concurrent (bool, optional): Whether the tree is safe to read from
+            many threads while another thread writes to it. Writers are
+            serialized by a lock and copy every node they change, publishing
+            the new root in a single assignment, so readers never block and
+            always see a consistent version of the tree. Defaults to False.
         """
         self.__root = None
-        self.__length = 0
+        self.__balanced = balanced
+        self.__concurrent = concurrent
+        self.__lock = Lock() if concurrent else nullcontext()
 
         if items:
-            for item in items:
-                self.add(item)
+            self.update(items)
+
+    @classmethod
+    def from_sorted(
+        cls, 
+        items: list, 
+        balanced: bool = False, 
+        concurrent: bool = False
+    ) -> 'Tree':
+        """Creates a perfectly balanced tree from a list of items that is
+        already in sorted order.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (list): The items to populate the tree with in sorted order
+            balanced (bool, optional): Whether the tree rebalances itself on
+            later insertions and removals. Defaults to False.
+            concurrent (bool, optional): Whether the tree is safe to read from
+            many threads while another thread writes to it. Defaults to False.
+
+        Returns:
+            Tree: The tree containing all the items
+        """
+        tree = cls(balanced=balanced, concurrent=concurrent)
+        tree.__root = cls.__build(cls.__group(items))
+
+        return tree
+
+    @staticmethod
+    def __group(items: Iterable) -> list:
+        """Groups consecutive equal items of a sorted iterable together.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (Iterable): The items in sorted order
+
+        Returns:
+            list: The groups of equal items in sorted order
+        """
+        groups = []
+        for item in items:
+            if groups and groups[-1][0] == item:
+                groups[-1].append(item)
+
+            else:
+                groups.append([item])
+
+        return groups
+
+    @classmethod
+    def __build(cls, items: list, start: int = 0, stop: int = None) -> __Node:
+        """Builds a perfectly balanced subtree from a sorted sublist of groups
+        of equal items by using the middle group as the root.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (list): The list of groups of equal items in sorted order
+            start (int, optional): The start index of the sublist. Defaults to
+            0.
+            stop (int, optional): The stop index of the sublist, exclusive;
+            None for the end of the list. Defaults to None.
+
+        Returns:
+            _Node: The root of the subtree; None if the sublist is empty
+        """
+        if stop is None:
+            stop = len(items)
+
+        if start >= stop:
+            return None
+
+        mid = (start + stop) // 2
+
+        value, *duplicates = items[mid]
+
+        node = cls.__Node(value, duplicates if duplicates else None)
+        node.left = cls.__build(items, start, mid)
+        node.right = cls.__build(items, mid + 1, stop)
+        node.update()
+
+        return node
+
+    def update(self, items: Iterable):
+        """Inserts many items into the tree at once by merging them with the
+        items of the tree and rebuilding it.
+
+        Time complexity: Θ(n + mlg(m)) where m is the number of new items
+
+        Args:
+            items (Iterable): The items to be inserted
+        """
+        with self.__lock:
+            merged = merge(self, sorted(items))
+            self.__root = self.__build(self.__group(merged))
+
+    def union(self, other: Iterable) -> 'Tree':
+        """Returns a new tree with the items in either tree. An item that 
+        occurs multiple times is kept as many times as it occurs in the tree
+        containing the most of it.
+
+        Time complexity: Θ(n + m)
+
+        Args:
+            other (Iterable): The other tree, or any iterable in sorted order
+
+        Returns:
+            Tree: The tree of all items in either tree
+        """
+        merged = Tree.__merge(self, other, True, True, True)
+        return Tree.from_sorted(merged, self.__balanced, self.__concurrent)
+
+    def intersection(self, other: Iterable) -> 'Tree':
+        """Returns a new tree with the items in both trees. An item that 
+        occurs multiple times is kept as many times as it occurs in the tree
+        containing the least of it.
+
+        Time complexity: Θ(n + m)
+
+        Args:
+            other (Iterable): The other tree, or any iterable in sorted order
+
+        Returns:
+            Tree: The tree of all items in both trees
+        """
+        merged = Tree.__merge(self, other, False, False, True)
+        return Tree.from_sorted(merged, self.__balanced, self.__concurrent)
+
+    def difference(self, other: Iterable) -> 'Tree':
+        """Returns a new tree with the items of this tree that are not in the
+        other tree. Each occurrence in the other tree removes one occurrence.
+
+        Time complexity: Θ(n + m)
+
+        Args:
+            other (Iterable): The other tree, or any iterable in sorted order
+
+        Returns:
+            Tree: The tree of all items in this tree but not the other tree
+        """
+        merged = Tree.__merge(self, other, True, False, False)
+        return Tree.from_sorted(merged, self.__balanced, self.__concurrent)
+
+    @staticmethod
+    def __merge(
+        left: Iterable, 
+        right: Iterable, 
+        keep_left: bool, 
+        keep_right: bool, 
+        keep_both: bool
+    ) -> Iterable:
+        """Walks two sorted iterables together, pairing up equal items.
+
+        Time complexity: Θ(n + m)
+
+        Args:
+            left (Iterable): The first iterable in sorted order
+            right (Iterable): The second iterable in sorted order
+            keep_left (bool): Whether items only in the left are kept
+            keep_right (bool): Whether items only in the right are kept
+            keep_both (bool): Whether items paired with an equal item are kept
+            as a single item
+
+        Returns:
+            Iterable: The iterator of kept items in sorted order
+        """
+        left, right = iter(left), iter(right)
+        done = object()
+
+        left_item, right_item = next(left, done), next(right, done)
+        while left_item is not done and right_item is not done:
+            if left_item < right_item:
+                if keep_left:
+                    yield left_item
+
+                left_item = next(left, done)
+
+            elif right_item < left_item:
+                if keep_right:
+                    yield right_item
+
+                right_item = next(right, done)
+
+            else:
+                if keep_both:
+                    yield left_item
+
+                left_item, right_item = next(left, done), next(right, done)
+
+        # Drains whichever iterable still has items
+        if left_item is not done and keep_left:
+            yield left_item
+            yield from left
+
+        if right_item is not done and keep_right:
+            yield right_item
+            yield from right
 
     def min(self) -> Any:
         """Returns the minimum item in the subtree.
@@ -127,9 +435,11 @@ class Tree:
             Any: The minimum item in the tree; None if there are not any
             items in the tree
         """
+        root = self.__root
+
         min_item = None
-        if self.__root:
-            min_item = self.__root.min()
+        if root:
+            min_item = root.min()
 
         return min_item
 
@@ -140,66 +450,185 @@ class Tree:
             Any: The maximum item in the tree: None if there are not any
             items in the tree
         """
+        root = self.__root
+
         max_item = None
-        if self.__root:
-            max_item = self.__root.max()
+        if root:
+            max_item = root.max()
 
         return max_item
 
     def add(self, value: Any):
-        """Inserts node into tree.
+        """Inserts node into tree. An item equal to an existing item is kept in
+        the same node after it, so the number of nodes only grows with the 
+        number of distinct items.
+
+        Time complexity O(log(n)) if balanced
 
         Args:
             node (Any): The value of the node to be inserted
         """
-        self.__length += 1
-        if self.__root:
-            self.__root.add(value)
+        with self.__lock:
+            path, node = self.__find(value)
 
-        else:
-            self.__root = self.__Node(value)
+            if node:
+                node = self.__own(node)
+                node.add_duplicate(value)
+                node.update()
+
+            else:
+                node = self.__Node(value)
+
+            self.__root = self.__retrace(path, node)
 
     def pop(self, value: Any):
-        """Removes an item from the tree.
+        """Removes an item from the tree. If there are multiple items equal to
+        the value, the most recently inserted one is removed.
+
+        Time complexity O(log(n)) if balanced
 
         Args:
             value (Any): The value of the node to be removed
         """
-        if self.__root:
-            self.__root = self.__pop(self.__root, value)
+        with self.__lock:
+            self.__pop(value)
 
-    def __pop(self, node: __Node, value: Any) -> __Node:
-        """Removes an item from the subtree.
+    def __pop(self, value: Any):
+        """Removes an item from the tree while holding the lock of the writers.
 
         Args:
-            node (_Node): The specified node
             value (Any): The value of the node to be removed
+        """
+        path, node = self.__find(value)
+        if not node:
+            return
+
+        if node.duplicate_count:
+            node = self.__own(node)
+            node.pop_duplicate(self.__concurrent)
+            node.update()
+            self.__root = self.__retrace(path, node)
+            return
+
+        # Replaces the value with its in-order predecessor, which is then
+        # removed instead since it does not have a right child
+        if node.left and node.right:
+            node = self.__own(node)
+            path.append((node, True))
+            predecessor = node.left
+            while predecessor.right:
+                path.append((predecessor, False))
+                predecessor = predecessor.right
+
+            node.value = predecessor.value
+            node.duplicates = predecessor.duplicates
+            node.duplicate_count = predecessor.duplicate_count
+            replacement = predecessor.left
+
+        else:
+            replacement = node.left if node.left else node.right
+
+        self.__root = self.__retrace(path, replacement)
+
+    def __find(self, value: Any) -> tuple:
+        """Walks down the tree to the node equal to a value, remembering the 
+        path taken.
+
+        Args:
+            value (Any): The value to be searched for
 
         Returns:
-            _Node:  The reference of the node to the parent node
+            tuple: The (node, went_left) pairs from the root down to the parent
+            of the last node visited, and the node equal to the value; None if
+            there is no such node
         """
-        if value < node.value:
-            if node.left:
-                node.left = self.__pop(node.left, value)
+        path = []
+        node = self.__root
+        while node:
+            if value < node.value:
+                went_left = True
 
-        elif value > node.value:
-            if node.right:
-                node.right = self.__pop(node.right, value)
+            elif value > node.value:
+                went_left = False
 
-        else:
-            if node.left:
-                left_max = node.left.max()
-                node.value = left_max
-                node.left = self.__pop(node.left, left_max)
+            else:
+                break
+
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+
+        return path, node
+
+    def __own(self, node: __Node) -> __Node:
+        """Returns a node that is safe to modify. In concurrent mode nodes that
+        may be visible to readers are never modified, so a copy is returned.
+
+        Args:
+            node (_Node): The node to be modified
+
+        Returns:
+            _Node: The node itself, or its copy in concurrent mode
+        """
+        return node.copy() if self.__concurrent else node
+
+    def __retrace(self, path: list, child: __Node) -> __Node:
+        """Reattaches a modified subtree and rebalances every node along the
+        path back up to the root, updating their heights and sizes.
+
+        Args:
+            path (list): The (node, went_left) pairs from the root down to the 
+            parent of the modified subtree
+            child (_Node): The new root of the modified subtree
 
-            elif node.right:
-                right_min = node.right.min()
-                node.value = right_min
-                node.right = self.__pop(node.right, right_min)
+        Returns:
+            _Node: The new root of the tree
+        """
+        for node, went_left in reversed(path):
+            node = self.__own(node)
+            if went_left:
+                node.left = child
 
             else:
-                node = None
-                self.__length -= 1
+                node.right = child
+
+            child = self.__rebalance(node)
+
+        return child
+
+    def __rebalance(self, node: __Node) -> __Node:
+        """Updates the height and size of a node and, if the tree is balanced, 
+        rotates the subtree so that the heights of its branches differ by at 
+        most one.
+
+        Args:
+            node (_Node): The root of the subtree
+
+        Returns:
+            _Node: The new root of the subtree
+        """
+        node.update()
+        if not self.__balanced:
+            return node
+
+        balance = node.balance()
+
+        # Left branch is too tall
+        if balance > 1:
+            left = node.left = self.__own(node.left)
+            if left.balance() < 0:
+                left.right = self.__own(left.right)
+                node.left = left.rotate_left()
+
+            node = node.rotate_right()
+
+        # Right branch is too tall
+        elif balance < -1:
+            right = node.right = self.__own(node.right)
+            if right.balance() > 0:
+                right.left = self.__own(right.left)
+                node.right = right.rotate_right()
+
+            node = node.rotate_left()
 
         return node
 
@@ -209,7 +638,39 @@ class Tree:
         Returns:
             int: The number of items in the tree
         """
-        return self.__length
+        root = self.__root
+        return root.size if root else 0
+
+    def stats(self) -> dict:
+        """Returns the shape of the tree. The average path length is the
+        average number of nodes visited when searching for each node,
+        counting the root as one.
+
+        Time complexity: Θ(n)
+
+        Returns:
+            dict: The height, the number of nodes and items, and the average
+            path length of the tree
+        """
+        root = self.__root
+        nodes, total_depth = 0, 0
+
+        stack = [(root, 1)] if root else []
+        while stack:
+            node, depth = stack.pop()
+            nodes += 1
+            total_depth += depth
+
+            for child in (node.left, node.right):
+                if child:
+                    stack.append((child, depth + 1))
+
+        return {
+            'height': root.height if root else 0,
+            'nodes': nodes,
+            'items': root.size if root else 0,
+            'average_path_length': total_depth / nodes if nodes else 0.0,
+        }
 
     def values(self) -> list:
         """Returns a list of of all the items in the tree in sorted order.
@@ -217,28 +678,219 @@ class Tree:
         Returns:
             list: List of all the items in the tree in sorted order
         """
-        return self.__root.values()
+        return list(self)
 
     def __iter__(self) -> Iterable:
-        """Returns an iterator of all items in order.
+        """Returns an iterator of all items in order. Items are produced
+        lazily by walking the tree with an explicit stack.
+
+        Time complexity: O(log(n)) for the first item if balanced, O(n) for
+        all items<br>
+        Memory space: O(h) where h is the height of the tree
 
         Returns:
             Iterable: The iterator of all items in order
         """
-        return iter(self.__root.values())
+        return self.__ascending(self.__root, None, None)
 
     def __reversed__(self) -> Iterable:
-        """Returns an iterator of all items in reverse order.
+        """Returns an iterator of all items in reverse order. Items are 
+        produced lazily by walking the tree with an explicit stack.
+
+        Time complexity: O(log(n)) for the first item if balanced, O(n) for
+        all items<br>
+        Memory space: O(h) where h is the height of the tree
 
         Returns:
             Iterable: The iterator of all items in reverse order
         """
-        return iter(reversed(self.__root.values()))
+        return self.__descending(self.__root)
+
+    @staticmethod
+    def __descending(node: __Node) -> Iterable:
+        """Walks a subtree in reverse order with an explicit stack.
+
+        Args:
+            node (_Node): The root of the subtree
+
+        Returns:
+            Iterable: The iterator of all items of the subtree in reverse order
+        """
+        stack = []
+        while stack or node:
+            # Descends to the rightmost node not yet visited
+            while node:
+                stack.append(node)
+                node = node.right
+
+            node = stack.pop()
+            for index in range(node.duplicate_count - 1, -1, -1):
+                yield node.duplicates[index]
+
+            yield node.value
+            node = node.left
+
+    def select(self, index: int) -> Any:
+        """Returns the item at the specified position in sorted order.
+
+        Time complexity O(log(n)) if balanced
+
+        Args:
+            index (int): The position of the item in sorted order; negative
+            indices count from the largest item
+
+        Raises:
+            IndexError: The index is out of range
+
+        Returns:
+            Any: The item at the specified position in sorted order
+        """
+        node = self.__root
+
+        length = node.size if node else 0
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError('tree index out of range')
+
+        while True:
+            left_size = node.left.size if node.left else 0
+            count = node.count()
+
+            if index < left_size:
+                node = node.left
+
+            elif index >= left_size + count:
+                index -= left_size + count
+                node = node.right
+
+            else:
+                index -= left_size
+                return node.duplicates[index - 1] if index else node.value
+
+    def rank(self, value: Any) -> int:
+        """Returns the number of items in the tree that are less than the 
+        specified value.
+
+        Time complexity O(log(n)) if balanced
+
+        Args:
+            value (Any): The value to rank
+
+        Returns:
+            int: The number of items less than the value
+        """
+        return self.__rank(self.__root, value, inclusive=False)
+
+    def count_range(self, lo: Any = None, hi: Any = None) -> int:
+        """Returns the number of items between two bounds, inclusive.
+
+        Time complexity O(log(n)) if balanced
+
+        Args:
+            lo (Any, optional): The lower bound; None if unbounded. Defaults to
+            None.
+            hi (Any, optional): The upper bound; None if unbounded. Defaults to
+            None.
+
+        Returns:
+            int: The number of items x where lo <= x <= hi
+        """
+        root = self.__root
+
+        below = self.__rank(root, lo, False) if lo is not None else 0
+        until = (
+            self.__rank(root, hi, True) if hi is not None 
+            else root.size if root else 0
+        )
+
+        return max(until - below, 0)
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterable:
+        """Returns an iterator of all items between two bounds, inclusive, in
+        order. Subtrees outside of the bounds are never visited.
+
+        Time complexity: O(log(n) + k) if balanced where k is the number of
+        items in range<br>
+        Memory space: O(h) where h is the height of the tree
+
+        Args:
+            lo (Any, optional): The lower bound; None if unbounded. Defaults to
+            None.
+            hi (Any, optional): The upper bound; None if unbounded. Defaults to
+            None.
+
+        Returns:
+            Iterable: The iterator of all items x where lo <= x <= hi
+        """
+        return self.__ascending(self.__root, lo, hi)
+
+    @staticmethod
+    def __ascending(node: __Node, lo: Any, hi: Any) -> Iterable:
+        """Walks a subtree in order with an explicit stack, skipping the items
+        outside of two bounds.
+
+        Args:
+            node (_Node): The root of the subtree
+            lo (Any): The lower bound; None if unbounded
+            hi (Any): The upper bound; None if unbounded
+
+        Returns:
+            Iterable: The iterator of all items x where lo <= x <= hi
+        """
+        stack = []
+        while stack or node:
+            # Descends to the leftmost node not below the lower bound
+            while node:
+                if lo is not None and node.value < lo:
+                    node = node.right
+
+                else:
+                    stack.append(node)
+                    node = node.left
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            if hi is not None and node.value > hi:
+                return
+
+            yield node.value
+            for index in range(node.duplicate_count):
+                yield node.duplicates[index]
+
+            node = node.right
+
+    @staticmethod
+    def __rank(node: __Node, value: Any, inclusive: bool) -> int:
+        """Returns the number of items in the subtree that are less than, or
+        optionally equal to, the specified value.
+
+        Args:
+            node (_Node): The root of the subtree
+            value (Any): The value to rank
+            inclusive (bool): Whether items equal to the value are counted
+
+        Returns:
+            int: The number of items less than (or equal to) the value
+        """
+        count = 0
+        while node:
+            if node.value < value or (inclusive and node.value == value):
+                count += (node.left.size if node.left else 0) + node.count()
+                node = node.right
+
+            else:
+                node = node.left
+
+        return count
 
     def __contains__(self, value: Any) -> bool:
         """Determines whether a value is in the tree.
 
-        Time complexity O(log(n))
+        Time complexity O(log(n)) if balanced
 
         Args:
             value (Any): The value to be searched for
@@ -246,7 +898,53 @@ class Tree:
         Returns:
             bool: Whether the value is in the tree
         """
-        return self.__root and self.__root.__contains__(value)
+        node = self.__root
+        while node:
+            if node.value == value:
+                return True
+
+            node = node.left if value < node.value else node.right
+
+        return False
+
+    def count(self, value: Any) -> int:
+        """Returns the number of items in the tree equal to the specified 
+        value.
+
+        Time complexity O(log(n)) if balanced
+
+        Args:
+            value (Any): The value to be counted
+
+        Returns:
+            int: The number of items equal to the value
+        """
+        node = self.__root
+        while node:
+            if node.value == value:
+                return node.count()
+
+            node = node.left if value < node.value else node.right
+
+        return 0
+
+    def snapshot(self) -> 'Tree':
+        """Returns a copy of the tree that is unaffected by later insertions and
+        removals. In concurrent mode both trees share all their nodes, since
+        nodes are never modified once published.
+
+        Time complexity: Θ(1) in concurrent mode, Θ(n) otherwise
+
+        Returns:
+            Tree: The copy of the tree
+        """
+        if not self.__concurrent:
+            return Tree.from_sorted(self, self.__balanced)
+
+        tree = Tree(balanced=self.__balanced, concurrent=True)
+        tree.__root = self.__root
+
+        return tree
 
     def __str__(self) -> str:
         """Returns a string containing all the items of the tree in sorted
@@ -256,4 +954,367 @@ class Tree:
             str: All the items in the tree in sorted order, delimited by a 
             space
         """
-        return self.__root.__str__().strip()
+        return ' '.join(str(item) for item in self)
+
+
+    def save(self, path: str):
+        """Writes the items of the tree in sorted order to a snapshot file that
+        can be memory-mapped by Tree.load. Integers and floats are stored as a
+        packed array; any other items are pickled individually behind a table
+        of offsets.
+
+        Time complexity: Θ(n)
+
+        Args:
+            path (str): The path of the snapshot file
+        """
+        # Writers may replace the root in between, so the length, the type
+        # and the items are all read from the same version of the tree
+        tree = self.snapshot() if self.__concurrent else self
+        MappedTree.write(path, tree, len(tree))
+
+    @staticmethod
+    def load(path: str) -> 'MappedTree':
+        """Memory-maps a snapshot file written by Tree.save. Items are read
+        straight from the mapping on demand, so the snapshot is queryable
+        without building any nodes.
+
+        Time complexity: Θ(1)
+
+        Args:
+            path (str): The path of the snapshot file
+
+        Returns:
+            MappedTree: The read-only view of the snapshot
+        """
+        return MappedTree(path)
+
+
+class MappedTree:
+    # Magic, version, typecode, byte order, padding, number of items
+    __HEADER = Struct('<4sBccxQ')
+    __MAGIC = b'TREE'
+    __VERSION = 1
+    __CHUNK = 1 << 16
+
+    def __init__(self, path: str):
+        """Memory-maps a snapshot file written by Tree.save.
+
+        Args:
+            path (str): The path of the snapshot file
+
+        Raises:
+            ValueError: The file is not a compatible snapshot
+        """
+        with open(path, 'rb') as file:
+            self.__map = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version, typecode, byteorder, length = self.__HEADER.unpack_from(
+            self.__map
+        )
+
+        if magic != self.__MAGIC or version != self.__VERSION:
+            self.__map.close()
+            raise ValueError(f'{path} is not a tree snapshot')
+
+        if byteorder.decode() != sys.byteorder[0]:
+            self.__map.close()
+            raise ValueError(f'{path} was written with another byte order')
+
+        self.__typecode = typecode.decode()
+        self.__length = length
+
+        # Packed numbers are indexed directly; pickled items go through the
+        # table of offsets to their serialized bytes
+        data = memoryview(self.__map)[self.__HEADER.size:]
+        if self.__typecode == 'O':
+            self.__offsets = data[:(length + 1) * 8].cast('q')
+            self.__sequence = self
+
+        else:
+            self.__offsets = None
+            self.__sequence = data[:length * 8].cast(self.__typecode)
+
+        data.release()
+
+    @classmethod
+    def write(cls, path: str, items: Iterable, length: int):
+        """Writes items in sorted order to a snapshot file.
+
+        Args:
+            path (str): The path of the snapshot file
+            items (Iterable): The items in sorted order; iterated twice
+            length (int): The number of items
+        """
+        typecode = cls.__typecode_of(items)
+
+        with open(path, 'wb') as file:
+            file.write(cls.__HEADER.pack(
+                cls.__MAGIC, 
+                cls.__VERSION, 
+                typecode.encode(), 
+                sys.byteorder[0].encode(), 
+                length
+            ))
+
+            if typecode != 'O':
+                chunk = array(typecode)
+                for item in items:
+                    chunk.append(item)
+                    if len(chunk) >= cls.__CHUNK:
+                        chunk.tofile(file)
+                        del chunk[:]
+
+                chunk.tofile(file)
+                return
+
+            # Reserves the table of offsets before writing the items
+            start = file.tell()
+            offsets = array('q')
+            file.seek((length + 1) * 8, 1)
+
+            for item in items:
+                offsets.append(file.tell())
+                pickle.dump(item, file, pickle.HIGHEST_PROTOCOL)
+
+            offsets.append(file.tell())
+            file.seek(start)
+            offsets.tofile(file)
+
+    @staticmethod
+    def __typecode_of(items: Iterable) -> str:
+        """Determines how the items are stored in a snapshot.
+
+        Args:
+            items (Iterable): The items to be stored
+
+        Returns:
+            str: 'q' if all items are 64-bit integers, 'd' if all items are
+            floats, 'O' otherwise
+        """
+        typecode = None
+        for item in items:
+            if type(item) is int and -(1 << 63) <= item < (1 << 63):
+                kind = 'q'
+
+            elif type(item) is float:
+                kind = 'd'
+
+            else:
+                return 'O'
+
+            if typecode and kind != typecode:
+                return 'O'
+
+            typecode = kind
+
+        return typecode if typecode else 'q'
+
+    def close(self):
+        """Unmaps the snapshot file."""
+        if self.__offsets is not None:
+            self.__offsets.release()
+
+        elif self.__sequence is not self:
+            self.__sequence.release()
+
+        self.__map.close()
+
+    def __enter__(self) -> 'MappedTree':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of items in the snapshot.
+
+        Returns:
+            int: The number of items in the snapshot
+        """
+        return self.__length
+
+    def __getitem__(self, index: int) -> Any:
+        """Returns the item at the specified position in sorted order.
+
+        Time complexity: Θ(1)
+
+        Args:
+            index (int): The position of the item in sorted order
+
+        Raises:
+            IndexError: The index is out of range
+
+        Returns:
+            Any: The item at the specified position in sorted order
+        """
+        if index < 0:
+            index += self.__length
+
+        if not 0 <= index < self.__length:
+            raise IndexError('tree index out of range')
+
+        if self.__offsets is None:
+            return self.__sequence[index]
+
+        start, stop = self.__offsets[index], self.__offsets[index + 1]
+        return pickle.loads(self.__map[start:stop])
+
+    def select(self, index: int) -> Any:
+        """Returns the item at the specified position in sorted order.
+
+        Time complexity: Θ(1)
+
+        Args:
+            index (int): The position of the item in sorted order
+
+        Returns:
+            Any: The item at the specified position in sorted order
+        """
+        return self[index]
+
+    def min(self) -> Any:
+        """Returns the minimum item in the snapshot.
+
+        Returns:
+            Any: The minimum item in the snapshot; None if there are not any
+            items in the snapshot
+        """
+        return self[0] if self.__length else None
+
+    def max(self) -> Any:
+        """Returns the maximum item in the snapshot.
+
+        Returns:
+            Any: The maximum item in the snapshot; None if there are not any
+            items in the snapshot
+        """
+        return self[-1] if self.__length else None
+
+    def rank(self, value: Any) -> int:
+        """Returns the number of items in the snapshot that are less than the
+        specified value.
+
+        Time complexity: O(log(n))
+
+        Args:
+            value (Any): The value to rank
+
+        Returns:
+            int: The number of items less than the value
+        """
+        return bisect_left(self.__sequence, value, 0, self.__length)
+
+    def count_range(self, lo: Any = None, hi: Any = None) -> int:
+        """Returns the number of items between two bounds, inclusive.
+
+        Time complexity: O(log(n))
+
+        Args:
+            lo (Any, optional): The lower bound; None if unbounded. Defaults to
+            None.
+            hi (Any, optional): The upper bound; None if unbounded. Defaults to
+            None.
+
+        Returns:
+            int: The number of items x where lo <= x <= hi
+        """
+        start, stop = self.__bounds(lo, hi)
+        return max(stop - start, 0)
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterable:
+        """Returns an iterator of all items between two bounds, inclusive, in
+        order.
+
+        Time complexity: O(log(n) + k) where k is the number of items in range
+
+        Args:
+            lo (Any, optional): The lower bound; None if unbounded. Defaults to
+            None.
+            hi (Any, optional): The upper bound; None if unbounded. Defaults to
+            None.
+
+        Returns:
+            Iterable: The iterator of all items x where lo <= x <= hi
+        """
+        start, stop = self.__bounds(lo, hi)
+        for index in range(start, stop):
+            yield self[index]
+
+    def __bounds(self, lo: Any, hi: Any) -> tuple:
+        """Returns the range of positions of the items between two bounds.
+
+        Args:
+            lo (Any): The lower bound; None if unbounded
+            hi (Any): The upper bound; None if unbounded
+
+        Returns:
+            tuple: The start and stop positions of the items in range
+        """
+        start, stop = 0, self.__length
+        if lo is not None:
+            start = bisect_left(self.__sequence, lo, 0, self.__length)
+
+        if hi is not None:
+            stop = bisect_right(self.__sequence, hi, 0, self.__length)
+
+        return start, stop
+
+    def count(self, value: Any) -> int:
+        """Returns the number of items in the snapshot equal to the specified 
+        value.
+
+        Time complexity: O(log(n))
+
+        Args:
+            value (Any): The value to be counted
+
+        Returns:
+            int: The number of items equal to the value
+        """
+        return self.count_range(value, value)
+
+    def __contains__(self, value: Any) -> bool:
+        """Determines whether a value is in the snapshot.
+
+        Time complexity: O(log(n))
+
+        Args:
+            value (Any): The value to be searched for
+
+        Returns:
+            bool: Whether the value is in the snapshot
+        """
+        index = self.rank(value)
+        return index < self.__length and self[index] == value
+
+    def __iter__(self) -> Iterable:
+        """Returns an iterator of all items in order.
+
+        Returns:
+            Iterable: The iterator of all items in order
+        """
+        return self.irange()
+
+    def __reversed__(self) -> Iterable:
+        """Returns an iterator of all items in reverse order.
+
+        Returns:
+            Iterable: The iterator of all items in reverse order
+        """
+        for index in range(self.__length - 1, -1, -1):
+            yield self[index]
+
+    def to_tree(self, balanced: bool = False) -> Tree:
+        """Builds a mutable tree from the snapshot.
+
+        Time complexity: Θ(n)
+
+        Args:
+            balanced (bool, optional): Whether the tree rebalances itself on
+            later insertions and removals. Defaults to False.
+
+        Returns:
+            Tree: The tree containing all the items of the snapshot
+        """
+        return Tree.from_sorted(self, balanced)
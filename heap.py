@@ -0,0 +1,295 @@
+from collections.abc import Iterable
+from itertools import chain, count
+from typing import Any
+
+class Heap:
+    def __init__(self, items: Iterable = None, key=None, arity: int = 4):
+        """Creates a min heap. Every node has up to arity children, so a wider
+        heap is shallower and keeps more of each path close together in the
+        list.
+
+        Args:
+            items (Iterable, optional): The items to populate the heap with.
+            Defaults to None.
+            key (function, optional): The function returning the priority of
+            an item; None to compare the items themselves. Items of equal
+            priority are popped in the order they were pushed. Defaults to
+            None.
+            arity (int, optional): The number of children of every node.
+            Defaults to 4.
+
+        Raises:
+            ValueError: The arity is less than 2
+        """
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+
+        self.__items = []
+        self.__key = key
+        self.__arity = arity
+        self.__counter = count()
+
+        if items is not None:
+            self.heapify(items)
+
+    def __entry(self, item: Any) -> Any:
+        """Returns the entry stored in the heap for an item. Keyed items are
+        stored with their priority and a sequence number breaking ties.
+
+        Args:
+            item (Any): The item to store
+
+        Returns:
+            Any: The item, or a tuple of its key, sequence number and the item
+        """
+        if self.__key is None:
+            return item
+
+        return self.__key(item), next(self.__counter), item
+
+    def __item(self, entry: Any) -> Any:
+        """Returns the item stored in an entry of the heap.
+
+        Args:
+            entry (Any): The entry in the heap
+
+        Returns:
+            Any: The item
+        """
+        return entry if self.__key is None else entry[-1]
+
+    def __len__(self) -> int:
+        """Returns the number of items in the heap.
+
+        Returns:
+            int: The number of items in the heap
+        """
+        return len(self.__items)
+
+    def __iter__(self) -> Iterable:
+        """Returns an iterator of all items in heap order, which is not
+        sorted order.
+
+        Returns:
+            Iterable: The iterator of all items
+        """
+        return map(self.__item, self.__items)
+
+    def peek(self) -> Any:
+        """Returns the smallest item without removing it.
+
+        Time complexity: Θ(1)
+
+        Raises:
+            IndexError: The heap is empty
+
+        Returns:
+            Any: The smallest item
+        """
+        if not self.__items:
+            raise IndexError('peek from empty heap')
+
+        return self.__item(self.__items[0])
+
+    def push(self, item: Any):
+        """Adds an item to the heap.
+
+        Time complexity: O(log(n))
+
+        Args:
+            item (Any): The item to add
+        """
+        self.__items.append(self.__entry(item))
+        Heap.sift_up(self.__items, len(self.__items) - 1, 0, self.__arity)
+
+    def pop(self) -> Any:
+        """Removes and returns the smallest item.
+
+        Time complexity: O(dlog(n)/log(d)) where d is the arity
+
+        Raises:
+            IndexError: The heap is empty
+
+        Returns:
+            Any: The smallest item
+        """
+        if not self.__items:
+            raise IndexError('pop from empty heap')
+
+        last = self.__items.pop()
+        if not self.__items:
+            return self.__item(last)
+
+        root, self.__items[0] = self.__items[0], last
+        Heap.sift_down(self.__items, 0, 0, len(self.__items), self.__arity)
+
+        return self.__item(root)
+
+    def pushpop(self, item: Any) -> Any:
+        """Adds an item and then removes and returns the smallest item, which
+        is faster than a push followed by a pop. The item itself is returned
+        without touching the heap if it is not larger than the smallest item.
+
+        Time complexity: O(dlog(n)/log(d)) where d is the arity
+
+        Args:
+            item (Any): The item to add
+
+        Returns:
+            Any: The smallest item
+        """
+        entry = self.__entry(item)
+        if not self.__items or not self.__items[0] < entry:
+            return item
+
+        root, self.__items[0] = self.__items[0], entry
+        Heap.sift_down(self.__items, 0, 0, len(self.__items), self.__arity)
+
+        return self.__item(root)
+
+    def replace(self, item: Any) -> Any:
+        """Removes and returns the smallest item and then adds an item, which
+        is faster than a pop followed by a push. The returned item may be
+        larger than the added one.
+
+        Time complexity: O(dlog(n)/log(d)) where d is the arity
+
+        Args:
+            item (Any): The item to add
+
+        Raises:
+            IndexError: The heap is empty
+
+        Returns:
+            Any: The smallest item before the item was added
+        """
+        if not self.__items:
+            raise IndexError('replace on empty heap')
+
+        root, self.__items[0] = self.__items[0], self.__entry(item)
+        Heap.sift_down(self.__items, 0, 0, len(self.__items), self.__arity)
+
+        return self.__item(root)
+
+    def heapify(self, items: Iterable):
+        """Adds many items at once by rebuilding the heap, which is faster
+        than pushing them one by one.
+
+        Time complexity: Θ(n + m) where m is the number of items added
+
+        Args:
+            items (Iterable): The items to add
+        """
+        self.__items.extend(map(self.__entry, items))
+        Heap.build(self.__items, 0, len(self.__items), self.__arity)
+
+    def merge(self, *others: Iterable):
+        """Adds every item of other heaps or iterables to the heap.
+
+        Time complexity: Θ(n + m) where m is the number of items added
+
+        Args:
+            *others (Iterable): The heaps or iterables to merge
+        """
+        self.heapify(chain.from_iterable(others))
+
+    @staticmethod
+    def build(items: list, start: int, stop: int, arity: int = 4):
+        """Converts a sublist into a min heap in place with Floyd's method,
+        sifting down every parent from the last one to the root.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, exclusive
+            arity (int, optional): The number of children of every node.
+            Defaults to 4.
+        """
+        for index in range((stop - start - 2) // arity, -1, -1):
+            Heap.sift_down(items, index, start, stop, arity)
+
+    @staticmethod
+    def sift_down(
+        items: list, 
+        index: int, 
+        start: int, 
+        stop: int, 
+        arity: int = 4
+    ):
+        """Restores the heap order below a node of a min heap stored in a
+        sublist, assuming the subtrees of its children are heaps.<br>
+        Leaves a hole at the node and moves it down to a leaf along the
+        smallest children, then moves the item of the node up from the leaf
+        into its place. Most items belong near the leaves, so this needs
+        fewer comparisons than stopping at the first child that is not
+        smaller, and items are moved into the hole instead of swapped. The
+        item is only compared with the smallest child of the node itself, to
+        return at once when it already belongs there.
+
+        Time complexity: O(dlog(n)/log(d)) where d is the arity
+
+        Args:
+            items (list): The list containing the heap
+            index (int): The index of the node relative to the start
+            start (int): The start index of the heap in the list
+            stop (int): The stop index of the heap in the list, exclusive
+            arity (int, optional): The number of children of every node.
+            Defaults to 4.
+        """
+        root = start + index
+        item = items[root]
+
+        position = root
+        child = start + arity * index + 1
+        while child < stop:
+            smallest, smallest_item = child, items[child]
+            for other in range(child + 1, min(child + arity, stop)):
+                if items[other] < smallest_item:
+                    smallest, smallest_item = other, items[other]
+
+            # The item already belongs at the node, as when every item is 
+            # equal, so the heap is left untouched
+            if position == root and not smallest_item < item:
+                return
+
+            items[position] = smallest_item
+            position = smallest
+            child = start + arity * (position - start) + 1
+
+        while position > root:
+            parent = start + (position - start - 1) // arity
+            if not item < items[parent]:
+                break
+
+            items[position] = items[parent]
+            position = parent
+
+        items[position] = item
+
+    @staticmethod
+    def sift_up(items: list, index: int, start: int, arity: int = 4):
+        """Restores the heap order above a node of a min heap stored in a
+        sublist by moving a hole up past every larger ancestor.
+
+        Time complexity: O(log(n)/log(d)) where d is the arity
+
+        Args:
+            items (list): The list containing the heap
+            index (int): The index of the node relative to the start
+            start (int): The start index of the heap in the list
+            arity (int, optional): The number of children of every node.
+            Defaults to 4.
+        """
+        item = items[start + index]
+
+        while index > 0:
+            parent = (index - 1) // arity
+            if not item < items[start + parent]:
+                break
+
+            items[start + index] = items[start + parent]
+            index = parent
+
+        items[start + index] = item
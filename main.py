@@ -1,11 +1,44 @@
 from binary_search_tree import Tree
+from heap import Heap
 from point import Point
+from search import Search, Eytzinger
 from sort import Sort
-from justin import justinheapsort
 
-from random import randint
-from time import perf_counter
+from argparse import ArgumentParser
+from random import randint, seed
+from statistics import median
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter, sleep
 from math import log2, ceil
+import json
+import logging
+import os
+import platform
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+QUADRATIC_METHODS = (Sort.bubble_sort, Sort.selection_sort, Sort.insertion_sort)
+INTEGER_METHODS = (Sort.counting_sort, Sort.radix_sort)
+SORTING_METHODS = (
+    Sort.sort,
+    Sort.bubble_sort,
+    Sort.selection_sort,
+    Sort.insertion_sort,
+    Sort.tree_sort,
+    Sort.heapsort,
+    Sort.quicksort,
+    Sort.three_way_quicksort,
+    Sort.merge_sort,
+    Sort.bottom_up_merge_sort,
+    Sort.adaptive_merge_sort,
+    Sort.counting_sort,
+    Sort.radix_sort,
+    Sort.parallel_sort,
+)
 
 def is_sorted(items):
     """Determines whether the list is in sorted order
@@ -22,39 +55,589 @@ def is_sorted(items):
         
     return True
 
-def testSorting(sorting_method, n):
-    """Runs 1000 tests of a sorting algorithm for lists of size n and prints 
-    whether all runs were successful
+def testSorting(sorting_method, n, trials=100):
+    """Runs tests of a sorting algorithm on every distribution of lists of 
+    size n and prints whether all runs were successful
 
     Args:
         sorting_method (function): The sorting algorithm to test
-        n (int): The size of the randomized list in each test
+        n (int): The size of the list in each test
+        trials (int): The number of tests for each distribution
     """
-    success = False
-    for _ in range(1000):
-        items = [randint(1, 999) for _ in range(n)]
-        sorting_method(items)
+    points = sorting_method not in INTEGER_METHODS
+    failed = []
+    for _ in range(trials):
+        for name, items in makeDistributions(n, points).items():
+            sorting_method(items)
 
-        if not (success := is_sorted(items)):
-            break
+            if not is_sorted(items) and name not in failed:
+                failed.append(name)
     
-    success = 'success' if success else 'fail'
+    success = f'fail ({", ".join(failed)})' if failed else 'success'
     print(f'"{sorting_method.__name__}" sort on list of size {n}: {success}')
 
-def timeSorting(sorting_method, items):
-    """Prints the time a sorting algorithm took to sort a list. Does not create
-    a copy of the list
+def timeSorting(sorting_method, items, repeats=5):
+    """Prints the median time a sorting algorithm took to sort copies of a 
+    list after one untimed warmup run. Copying the list is not timed
 
     Args:
         sorting_method (function): The sorting algorithm to test
         items (list): The list used to time a sort
+        repeats (int): The number of timed runs
     """
-    start_time = perf_counter()
-    sorting_method(items)
-    total_time = perf_counter() - start_time
+    times = measure(sorting_method, lambda: items[:], 1, repeats)
+    total_time = median(times)
 
     print(f'{f"{sorting_method.__name__}":>16}: {total_time:>6.4f} s')
 
+def makeDistributions(n, points=True):
+    """Creates lists of size n with the input distributions used to test and
+    benchmark sorting algorithms
+
+    Args:
+        n (int): The size of each list
+        points (bool): Whether to include a list of Point objects
+
+    Returns:
+        dict: The lists keyed by the name of their distribution
+    """
+    nearly_sorted = list(range(n))
+    for _ in range(ceil(log2(n + 1))):
+        i, j = randint(0, n - 1), randint(0, n - 1)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+
+    distributions = {
+        'random': [randint(0, n) for _ in range(n)],
+        'sorted': list(range(n)),
+        'reversed': list(range(n, 0, -1)),
+        'few unique': [randint(1, 8) for _ in range(n)],
+        'organ pipe': [min(i, n - i) for i in range(n)],
+        'nearly sorted': nearly_sorted,
+    }
+
+    if points:
+        distributions['points'] = [
+            Point(randint(0, n), randint(0, n)) for _ in range(n)
+        ]
+
+    return distributions
+
+def logSizes(max_size, min_size=10, factor=10):
+    """Returns sizes from min_size to max_size growing by a constant factor
+
+    Args:
+        max_size (int): The largest size
+        min_size (int): The smallest size
+        factor (int): The ratio between consecutive sizes
+
+    Returns:
+        list: The sizes in ascending order
+    """
+    sizes = []
+    while min_size <= max_size:
+        sizes.append(min_size)
+        min_size *= factor
+
+    return sizes
+
+def measure(function, setup, warmups, repeats):
+    """Times a function on fresh inputs after untimed warmup runs
+
+    Args:
+        function (function): The function to time
+        setup (function): Returns the argument of each run. Its time is not
+        measured
+        warmups (int): The number of untimed runs
+        repeats (int): The number of timed runs
+
+    Returns:
+        list: The time of each timed run in seconds
+    """
+    times = []
+    for run in range(warmups + repeats):
+        argument = setup()
+
+        start_time = perf_counter()
+        function(argument)
+        total_time = perf_counter() - start_time
+
+        if run >= warmups:
+            times.append(total_time)
+
+    return times
+
+def summarize(times):
+    """Returns the median, 95th percentile and minimum of timed runs
+
+    Args:
+        times (list): The time of each run in seconds
+
+    Returns:
+        dict: The statistics of the runs
+    """
+    times = sorted(times)
+
+    return {
+        'median': median(times),
+        'p95': times[ceil(0.95 * len(times)) - 1],
+        'min': times[0],
+        'runs': len(times),
+    }
+
+def treeOperations(items, directory):
+    """Returns the tree operations to benchmark on a list. Each operation takes
+    a copy of the list and the balanced tree built from it. Set operations 
+    combine the tree with every other item of the sorted list, and loading a
+    snapshot reads back every item
+
+    Args:
+        items (list): The list the trees are built from
+        directory (str): The directory to write snapshot files into
+
+    Returns:
+        dict: The operations keyed by their name
+    """
+    ordered = sorted(items)
+    other = ordered[::2]
+    lo, hi = ordered[len(ordered) // 4], ordered[3 * len(ordered) // 4]
+
+    save_path = os.path.join(directory, 'save.tree')
+    load_path = os.path.join(directory, 'load.tree')
+    Tree.from_sorted(ordered).save(load_path)
+
+    def add(items, tree):
+        tree = Tree(balanced=True)
+        for item in items:
+            tree.add(item)
+
+    def pop(items, tree):
+        for item in items:
+            tree.pop(item)
+
+    def contains(items, tree):
+        for item in items:
+            item in tree
+
+    def select(items, tree):
+        for i in range(len(tree)):
+            tree.select(i)
+
+    def rank(items, tree):
+        for item in items:
+            tree.rank(item)
+
+    def countRange(items, tree):
+        for item in items:
+            tree.count_range(item, item)
+
+    def load(items, tree):
+        with Tree.load(load_path) as snapshot:
+            for i in range(len(snapshot)):
+                snapshot[i]
+
+    return {
+        'Tree.__init__': lambda items, tree: Tree(items, balanced=True),
+        'Tree.add': add,
+        'Tree.pop': pop,
+        'Tree.__contains__': contains,
+        'Tree.__iter__': lambda items, tree: list(tree),
+        'Tree.select': select,
+        'Tree.rank': rank,
+        'Tree.irange': lambda items, tree: list(tree.irange(lo, hi)),
+        'Tree.count_range': countRange,
+        'Tree.from_sorted': lambda items, tree: Tree.from_sorted(
+            ordered, balanced=True
+        ),
+        'Tree.update': lambda items, tree: tree.update(items),
+        'Tree.union': lambda items, tree: tree.union(other),
+        'Tree.intersection': lambda items, tree: tree.intersection(other),
+        'Tree.difference': lambda items, tree: tree.difference(other),
+        'Tree.save': lambda items, tree: tree.save(save_path),
+        'Tree.load': load,
+    }
+
+def runBenchmarks(
+    sizes, 
+    warmups=1, 
+    repeats=5, 
+    quadratic_limit=4096, 
+    methods=SORTING_METHODS, 
+    counters=False
+):
+    """Times every sorting algorithm and tree operation on every distribution
+    and size, and prints the median and 95th percentile of each. Operation 
+    counts are measured in a separate untimed run so they do not slow down the
+    timed runs
+
+    Args:
+        sizes (list): The sizes of the lists
+        warmups (int): The number of untimed runs of each benchmark
+        repeats (int): The number of timed runs of each benchmark
+        quadratic_limit (int): The largest size quadratic algorithms run on
+        methods (tuple): The sorting algorithms to time
+        counters (bool): Whether to report the counters of Sort.measure for
+        sorting algorithms and Tree.stats for tree operations
+
+    Returns:
+        dict: The environment and the statistics of every benchmark
+    """
+    results = []
+
+    def record(operation, distribution, n, times, operation_counters):
+        stats = summarize(times)
+        results.append({
+            'operation': operation,
+            'distribution': distribution,
+            'n': n,
+            **stats,
+        })
+
+        counts = ''
+        if operation_counters is not None:
+            results[-1]['counters'] = operation_counters
+            counts = ', ' + ', '.join(
+                f'{name} {count:,.6g}' 
+                for name, count in operation_counters.items()
+            )
+
+        print(
+            f'{operation:>20} {distribution:>14} {n:>9}: '
+            f'{stats["median"]:>8.4f} s median, {stats["p95"]:>8.4f} s p95'
+            f'{counts}'
+        )
+
+    for n in sizes:
+        for distribution, items in makeDistributions(n).items():
+            points = distribution == 'points'
+
+            for sorting_method in methods:
+                if sorting_method in QUADRATIC_METHODS and n > quadratic_limit:
+                    continue
+
+                if sorting_method in INTEGER_METHODS and points:
+                    continue
+
+                times = measure(
+                    sorting_method, lambda: items[:], warmups, repeats
+                )
+                sort_counters = (
+                    Sort.measure(sorting_method, items[:]) if counters else None
+                )
+                record(
+                    sorting_method.__name__, distribution, n, times, 
+                    sort_counters
+                )
+
+            tree_counters = (
+                Tree(items, balanced=True).stats() if counters else None
+            )
+            with TemporaryDirectory() as directory:
+                operations = treeOperations(items, directory)
+                for operation, function in operations.items():
+                    setup = lambda: (items[:], Tree(items, balanced=True))
+                    times = measure(
+                        lambda args: function(*args), setup, warmups, repeats
+                    )
+                    record(operation, distribution, n, times, tree_counters)
+
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'sizes': list(sizes),
+        'warmups': warmups,
+        'repeats': repeats,
+        'results': results,
+    }
+
+def compareBenchmarks(baseline, current, threshold=0.1):
+    """Prints the change in median time of every benchmark found in both runs
+    and flags those slower than the baseline by more than the threshold
+
+    Args:
+        baseline (dict): The results of the earlier run
+        current (dict): The results of the later run
+        threshold (float): The relative slowdown counted as a regression
+
+    Returns:
+        list: The names of the regressed benchmarks
+    """
+    def key(result):
+        return result['operation'], result['distribution'], result['n']
+
+    before = {key(result): result for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        if (old := before.get(key(result))) is None:
+            continue
+
+        ratio = result['median'] / old['median'] if old['median'] else 1.0
+        regressed = ratio > 1 + threshold
+
+        operation, distribution, n = key(result)
+        name = f'{operation} {distribution} {n}'
+        if regressed:
+            regressions.append(name)
+
+        print(
+            f'{operation:>20} {distribution:>14} {n:>9}: '
+            f'{old["median"]:>8.4f} s -> {result["median"]:>8.4f} s '
+            f'({ratio:.2f}x){" REGRESSION" if regressed else ""}'
+        )
+
+    print(f'{len(regressions)} regressions')
+    return regressions
+
+def compareMergeSorts(n):
+    """Prints the time merge_sort and adaptive_merge_sort take to sort lists
+    of size n that are random, sorted, reversed, nearly sorted, or made of a
+    few sorted runs
+
+    Args:
+        n (int): The size of each list
+    """
+    nearly_sorted = list(range(n))
+    for _ in range(ceil(log2(n + 1))):
+        i, j = randint(0, n - 1), randint(0, n - 1)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+
+    distributions = {
+        'random': [randint(1, 999) for _ in range(n)],
+        'sorted': list(range(n)),
+        'reversed': list(range(n, 0, -1)),
+        'nearly sorted': nearly_sorted,
+        'sorted runs': [i % (n // 8 + 1) for i in range(n)],
+    }
+
+    for name, items in distributions.items():
+        print(name)
+        timeSorting(Sort.merge_sort, items[:])
+        timeSorting(Sort.adaptive_merge_sort, items[:])
+
+def compareQuicksorts(n):
+    """Prints the time quicksort and three_way_quicksort take to sort lists of
+    size n with few to many distinct items
+
+    Args:
+        n (int): The size of each list
+    """
+    for distinct in (2, 10, 1000, n):
+        items = [randint(1, distinct) for _ in range(n)]
+
+        print(f'{distinct} distinct')
+        timeSorting(Sort.quicksort, items[:])
+        timeSorting(Sort.three_way_quicksort, items[:])
+
+def compareIntegerSorts(n):
+    """Prints the time counting_sort, radix_sort, quicksort and the built-in
+    sort take to sort lists of n integers with small and large ranges
+
+    Args:
+        n (int): The size of each list
+    """
+    for low, high in ((1, 999), (-2 ** 31, 2 ** 31), (0, 2 ** 62)):
+        items = [randint(low, high) for _ in range(n)]
+
+        print(f'range [{low}, {high}]')
+        if high - low <= 16 * n:
+            timeSorting(Sort.counting_sort, items[:])
+
+        timeSorting(Sort.radix_sort, items[:])
+        timeSorting(Sort.quicksort, items[:])
+        timeSorting(list.sort, items[:])
+
+def scaleParallelSort(n, max_workers):
+    """Prints the time parallel_sort takes to sort the same list of size n
+    with 1 to max_workers processes, and the speedup over a single process
+
+    Args:
+        n (int): The size of the list
+        max_workers (int): The largest number of processes
+    """
+    items = [randint(1, 999) for _ in range(n)]
+
+    base_time = None
+    for workers in range(1, max_workers + 1):
+        copy = items[:]
+
+        start_time = perf_counter()
+        Sort.parallel_sort(copy, workers)
+        total_time = perf_counter() - start_time
+
+        base_time = base_time if base_time else total_time
+        print(
+            f'{workers:>2} workers: {total_time:>6.4f} s '
+            f'({base_time / total_time:.2f}x)'
+        )
+
+def compareHeapArities(n, max_arity=8):
+    """Prints the time a heap of each arity from 2 to max_arity takes to push
+    and then pop n random items
+
+    Args:
+        n (int): The number of items
+        max_arity (int): The largest number of children of every node
+    """
+    items = [randint(1, 10 * n) for _ in range(n)]
+
+    for arity in range(2, max_arity + 1):
+        def pushPop(values):
+            heap = Heap(arity=arity)
+            for value in values:
+                heap.push(value)
+
+            while heap:
+                heap.pop()
+
+        total_time = median(measure(pushPop, lambda: items, 1, 5))
+        print(f'{arity:>2}-ary: {total_time:>6.4f} s')
+
+def compareTopK(n, k):
+    """Prints the time a full sort, partial_sort, nsmallest and select take 
+    to find the k smallest of n random items
+
+    Args:
+        n (int): The number of items
+        k (int): The number of smallest items to find
+    """
+    items = [randint(1, 10 * n) for _ in range(n)]
+
+    for name, function in (
+        ('quicksort', lambda values: Sort.quicksort(values)),
+        ('partial_sort', lambda values: Sort.partial_sort(values, k)),
+        ('nsmallest', lambda values: Sort.nsmallest(values, k)),
+        ('select', lambda values: Sort.select(values, k - 1)),
+    ):
+        total_time = median(measure(function, lambda: items[:], 1, 5))
+        print(f'{name:>16}: {total_time:>6.4f} s')
+
+def compareResort(n, d):
+    """Prints the time resort, adaptive_merge_sort and quicksort take to sort
+    a sorted list of size n again after d random items are appended to it, 
+    and after d random items of it are changed
+
+    Args:
+        n (int): The size of the sorted list
+        d (int): The number of appended or changed items
+    """
+    items = sorted(randint(1, 10 * n) for _ in range(n))
+    appended = items + [randint(1, 10 * n) for _ in range(d)]
+
+    changed = items[:]
+    indices = [randint(0, n - 1) for _ in range(d)]
+    for index in indices:
+        changed[index] = randint(1, 10 * n)
+
+    for name, items, dirty in (
+        ('appended', appended, n), ('changed', changed, indices)
+    ):
+        print(name)
+        for method, function in (
+            ('resort', lambda values: Sort.resort(values, dirty)),
+            ('adaptive_merge_sort', Sort.adaptive_merge_sort),
+            ('quicksort', Sort.quicksort),
+        ):
+            total_time = median(measure(function, lambda: items[:], 1, 5))
+            print(f'{method:>20}: {total_time:>6.4f} s')
+
+def comparePointKeys(n):
+    """Prints the time comparison sorts take to sort n points by comparing the
+    points themselves, and by a key function that extracts x once per point
+
+    Args:
+        n (int): The number of points
+    """
+    points = [Point(randint(1, 999), randint(1, 999)) for _ in range(n)]
+
+    for sorting_method in (Sort.quicksort, Sort.heapsort, Sort.merge_sort):
+        items = points[:]
+        start_time = perf_counter()
+        sorting_method(items)
+        compared_time = perf_counter() - start_time
+
+        items = points[:]
+        start_time = perf_counter()
+        sorting_method(items, key=lambda point: point.x)
+        keyed_time = perf_counter() - start_time
+
+        print(
+            f'{sorting_method.__name__:>16}: {compared_time:>6.4f} s compared, '
+            f'{keyed_time:>6.4f} s keyed'
+        )
+
+def stressConcurrentTree(n, readers=4, max_writers=4, duration=1.0):
+    """Prints the read throughput of a concurrent tree of size n while an
+    increasing number of threads write to it
+
+    Args:
+        n (int): The number of items in the tree
+        readers (int): The number of threads looking up random items
+        max_writers (int): The largest number of threads adding and removing 
+        random items
+        duration (float): The number of seconds each configuration runs for
+    """
+    for writers in range(max_writers + 1):
+        tree = Tree(range(0, 2 * n, 2), balanced=True, concurrent=True)
+        stop = Event()
+        reads = [0] * readers
+
+        def read(index):
+            while not stop.is_set():
+                randint(0, 2 * n) in tree
+                reads[index] += 1
+
+        def write():
+            while not stop.is_set():
+                item = randint(0, 2 * n)
+                if item in tree:
+                    tree.pop(item)
+
+                else:
+                    tree.add(item)
+
+        threads = [Thread(target=read, args=(i,)) for i in range(readers)]
+        threads += [Thread(target=write) for _ in range(writers)]
+
+        for thread in threads:
+            thread.start()
+
+        sleep(duration)
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+
+        throughput = sum(reads) / duration
+        print(f'{writers:>2} writers: {throughput:>12,.0f} reads/s')
+
+def compareSearches(n, m):
+    """Prints the time binary_search and the search module take to look up m
+    random queries in a sorted list of n items
+
+    Args:
+        n (int): The number of items
+        m (int): The number of queries
+    """
+    items = sorted(randint(1, 10 * n) for _ in range(n))
+    queries = [randint(1, 10 * n) for _ in range(m)]
+    layout = Eytzinger(items)
+
+    searches = {
+        'binary_search': lambda: [binary_search(items, q) for q in queries],
+        'lower_bound': lambda: [Search.lower_bound(items, q) for q in queries],
+        'search_many': lambda: Search.search_many(items, queries),
+        'eytzinger': lambda: [layout.lower_bound(q) for q in queries],
+        'eytzinger many': lambda: layout.search_many(queries),
+    }
+
+    if np is not None:
+        numbers = np.array(items)
+        searches['searchsorted'] = lambda: Search.search_many(numbers, queries)
+
+    for name, search in searches.items():
+        total_time = median(measure(lambda _: search(), lambda: None, 1, 5))
+        print(f'{name:>16}: {total_time:>6.4f} s')
+
 def binary_search(items, element):
     index = -1
     start = 0
@@ -77,4 +660,59 @@ def binary_search(items, element):
 
 
 if __name__ == '__main__':
-    pass
\ No newline at end of file
+    parser = ArgumentParser(description='Benchmarks the sorting algorithms')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='time every benchmark')
+    run.add_argument('--max-size', type=int, default=10 ** 4)
+    run.add_argument('--min-size', type=int, default=10)
+    run.add_argument('--factor', type=int, default=10)
+    run.add_argument('--warmups', type=int, default=1)
+    run.add_argument('--repeats', type=int, default=5)
+    run.add_argument('--quadratic-limit', type=int, default=4096)
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--output', help='write the results as JSON')
+    run.add_argument(
+        '--counters', 
+        action='store_true', 
+        help='report operation counts and tree shapes next to timings'
+    )
+    run.add_argument(
+        '--log-decisions', 
+        action='store_true', 
+        help='print the engine chosen by Sort.sort for every run'
+    )
+
+    compare = commands.add_parser('compare', help='compare two JSON results')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.1)
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        if args.log_decisions:
+            logging.basicConfig(format='%(message)s')
+            logging.getLogger('sort').setLevel(logging.DEBUG)
+
+        seed(args.seed)
+        sizes = logSizes(args.max_size, args.min_size, args.factor)
+        results = runBenchmarks(
+            sizes, 
+            args.warmups, 
+            args.repeats, 
+            args.quadratic_limit, 
+            counters=args.counters
+        )
+
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=4)
+
+    else:
+        with open(args.baseline) as baseline, open(args.current) as current:
+            regressions = compareBenchmarks(
+                json.load(baseline), json.load(current), args.threshold
+            )
+
+        raise SystemExit(1 if regressions else 0)
\ No newline at end of file
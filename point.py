@@ -1,4 +1,15 @@
+from array import array
+from sort import Sort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -22,4 +33,140 @@ class Point:
         return self.x != other.x
     
     def __str__(self):
-        return f'({self.x}, {self.y})'
\ No newline at end of file
+        return f'({self.x}, {self.y})'
+
+
+class PointArray:
+    def __init__(self, points=(), typecode='d'):
+        """Creates a collection of points stored as two parallel arrays of x 
+        and y coordinates instead of one object per point.
+
+        Args:
+            points (Iterable, optional): The points to store. Defaults to ().
+            typecode (str, optional): The array typecode of the coordinates.
+            Defaults to 'd'.
+        """
+        points = list(points)
+        self.xs = array(typecode, [point.x for point in points])
+        self.ys = array(typecode, [point.y for point in points])
+
+    @classmethod
+    def from_coordinates(cls, xs, ys, typecode='d'):
+        """Creates a collection of points from sequences of coordinates.
+
+        Args:
+            xs (Iterable): The x coordinates
+            ys (Iterable): The y coordinates
+            typecode (str, optional): The array typecode of the coordinates.
+            Defaults to 'd'.
+
+        Returns:
+            PointArray: The collection of points
+        """
+        points = cls(typecode=typecode)
+        points.xs.extend(xs)
+        points.ys.extend(ys)
+
+        if len(points.xs) != len(points.ys):
+            raise ValueError('xs and ys must have the same length')
+
+        return points
+
+    def append(self, point):
+        self.xs.append(point.x)
+        self.ys.append(point.y)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        """Returns the point at the index, created only when accessed, or a new
+        collection of the points in a slice.
+        """
+        if isinstance(index, slice):
+            return PointArray.from_coordinates(
+                self.xs[index], self.ys[index], self.xs.typecode
+            )
+
+        return Point(self.xs[index], self.ys[index])
+
+    def __setitem__(self, index, point):
+        if isinstance(index, slice):
+            points = list(point)
+            self.xs[index] = array(self.xs.typecode, [p.x for p in points])
+            self.ys[index] = array(self.ys.typecode, [p.y for p in points])
+
+        else:
+            self.xs[index], self.ys[index] = point.x, point.y
+
+    def __iter__(self):
+        for x, y in zip(self.xs, self.ys):
+            yield Point(x, y)
+
+    def argsort(self, reverse=False):
+        """Returns the permutation that sorts the points by x, breaking ties by
+        y, without creating or comparing any points. Points with equal 
+        coordinates keep their order.
+
+        Args:
+            reverse (bool, optional): Whether to sort in descending order.
+            Defaults to False.
+
+        Returns:
+            list: The indices of the points in sorted order
+        """
+        if np is not None:
+            return self.__lexsort(reverse).tolist()
+
+        # Sorting by y and then stably by x leaves ties in x ordered by y
+        order = list(range(len(self)))
+        Sort.adaptive_merge_sort(order, self.ys.__getitem__, reverse)
+        Sort.adaptive_merge_sort(order, self.xs.__getitem__, reverse)
+
+        return order
+
+    def sort(self, reverse=False):
+        """Sorts the points in place by x, breaking ties by y, by permuting
+        both coordinate arrays.
+
+        Args:
+            reverse (bool, optional): Whether to sort in descending order.
+            Defaults to False.
+        """
+        if np is not None:
+            order = self.__lexsort(reverse)
+
+            xs = np.frombuffer(self.xs, dtype=self.xs.typecode)
+            ys = np.frombuffer(self.ys, dtype=self.ys.typecode)
+            xs[:] = xs[order]
+            ys[:] = ys[order]
+
+            return
+
+        order = self.argsort(reverse)
+
+        self.xs = array(self.xs.typecode, [self.xs[i] for i in order])
+        self.ys = array(self.ys.typecode, [self.ys[i] for i in order])
+
+    def __lexsort(self, reverse):
+        """Returns the permutation that sorts the points with NumPy.
+
+        Args:
+            reverse (bool): Whether to sort in descending order
+
+        Returns:
+            np.ndarray: The indices of the points in sorted order
+        """
+        xs = np.frombuffer(self.xs, dtype=self.xs.typecode)
+        ys = np.frombuffer(self.ys, dtype=self.ys.typecode)
+
+        if not reverse:
+            return np.lexsort((ys, xs))
+
+        # Sorting the reversed points and reversing the result keeps ties in
+        # their original order
+        order = np.lexsort((ys[::-1], xs[::-1]))[::-1]
+        return len(self) - 1 - order
+
+    def __str__(self):
+        return ' '.join(str(point) for point in self)
@@ -0,0 +1,350 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from sort import Sort
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Search():
+    @staticmethod
+    def lower_bound(
+        items: list,
+        value: Any,
+        start: int = 0,
+        stop: int = None,
+        key=None
+    ) -> int:
+        """Returns the first index of a sorted list whose item is not less
+        than the value, which is where the value would be inserted before any
+        equal items.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            items (list): The sorted list to search
+            value (Any): The value to search for, compared with the keys of
+            the items if a key is given
+            start (int, optional): The start index of the search. Defaults to
+            0.
+            stop (int, optional): The stop index of the search, exclusive; None
+            to search to the end. Defaults to None.
+            key (function, optional): The function returning the key of an
+            item; None to compare the items themselves. Defaults to None.
+
+        Returns:
+            int: The index of the first item not less than the value
+        """
+        stop = len(items) if stop is None else stop
+        return bisect_left(items, value, start, stop, key=key)
+
+    @staticmethod
+    def upper_bound(
+        items: list,
+        value: Any,
+        start: int = 0,
+        stop: int = None,
+        key=None
+    ) -> int:
+        """Returns the first index of a sorted list whose item is greater than
+        the value, which is where the value would be inserted after any equal
+        items.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            items (list): The sorted list to search
+            value (Any): The value to search for, compared with the keys of
+            the items if a key is given
+            start (int, optional): The start index of the search. Defaults to
+            0.
+            stop (int, optional): The stop index of the search, exclusive; None
+            to search to the end. Defaults to None.
+            key (function, optional): The function returning the key of an
+            item; None to compare the items themselves. Defaults to None.
+
+        Returns:
+            int: The index of the first item greater than the value
+        """
+        stop = len(items) if stop is None else stop
+        return bisect_right(items, value, start, stop, key=key)
+
+    @staticmethod
+    def index(items: list, value: Any) -> int:
+        """Returns the index of the first item of a sorted list equal to the
+        value.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            items (list): The sorted list to search
+            value (Any): The value to search for
+
+        Returns:
+            int: The index of the value; -1 if it is not in the list
+        """
+        position = bisect_left(items, value)
+        if position < len(items) and not value < items[position]:
+            return position
+
+        return -1
+
+    @staticmethod
+    def search_many(
+        items: list,
+        queries: Iterable,
+        side: str = 'left'
+    ) -> list:
+        """Returns the lower or upper bound of every query in a sorted list.
+        <br>
+        Numeric buffers are searched with NumPy's searchsorted. Otherwise the
+        queries are sorted and answered in ascending order, so consecutive 
+        searches walk down nearly the same path of the list and find it in 
+        the cache. When there are at least as many queries as items, the list
+        and the sorted queries are swept together like a merge instead.
+
+        Time complexity: O(mlog(m) + min(mlog(n), n + m)) for m queries
+
+        Args:
+            items (list): The sorted list or buffer to search
+            queries (Iterable): The values to search for
+            side (str, optional): 'left' for the first index not less than
+            each query, 'right' for the first index greater than it. Defaults
+            to 'left'.
+
+        Raises:
+            ValueError: The side is neither 'left' nor 'right'
+
+        Returns:
+            list: The index of every query, in the order of the queries
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+
+        queries = list(queries)
+        if (view := Sort.numeric_view(items)) is not None:
+            return np.searchsorted(view, np.asarray(queries), side).tolist()
+
+        order = sorted(range(len(queries)), key=queries.__getitem__)
+
+        length = len(items)
+        left = side == 'left'
+        bisect = bisect_left if left else bisect_right
+        sweep = length <= len(queries)
+
+        results = [0] * len(queries)
+        position = 0
+        for index in order:
+            query = queries[index]
+
+            if not sweep:
+                position = bisect(items, query, position)
+
+            elif left:
+                while position < length and items[position] < query:
+                    position += 1
+
+            else:
+                while position < length and not query < items[position]:
+                    position += 1
+
+            results[index] = position
+
+        return results
+
+
+class Eytzinger:
+    # NumPy types that hold every value of a Python type exactly
+    __DTYPES = {int: 'int64', float: 'float64'}
+
+    def __init__(self, items: Iterable):
+        """Stores a sorted list in Eytzinger order, the order of a breadth
+        first traversal of the balanced binary search tree over the items.
+        Node k has children 2k and 2k + 1, so the nodes a search visits are
+        packed at the front of the list, and each step is a comparison added
+        to the index instead of a branch.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (Iterable): The items in sorted order
+        """
+        items = list(items)
+        length = len(items)
+
+        # Index 0 is unused so that node k has children 2k and 2k + 1
+        self.__nodes = [None] * (length + 1)
+        self.__ranks = [length] * (length + 1)
+
+        # Visits the nodes in order with an explicit stack, assigning the
+        # sorted items one by one
+        rank = 0
+        stack = []
+        node = 1
+        while stack or node <= length:
+            if node <= length:
+                stack.append(node)
+                node *= 2
+                continue
+
+            node = stack.pop()
+            self.__nodes[node] = items[rank]
+            self.__ranks[node] = rank
+            rank += 1
+            node = 2 * node + 1
+
+        self.__length = length
+        self.__type = type(items[0]) if length else None
+        self.__array = None
+        self.__rank_array = None
+
+        # Only items of one type with an exact dtype are vectorized, since
+        # mixed ints and floats would be compared as rounded float64s
+        if np is not None and self.__type in Eytzinger.__DTYPES and all(
+            type(item) is self.__type for item in items
+        ):
+            try:
+                self.__array = np.array(
+                    self.__nodes[1:], 
+                    dtype=Eytzinger.__DTYPES[self.__type]
+                )
+                self.__rank_array = np.array(self.__ranks, dtype=np.int64)
+
+            except OverflowError:
+                pass
+
+    def __len__(self) -> int:
+        """Returns the number of items.
+
+        Returns:
+            int: The number of items
+        """
+        return self.__length
+
+    def lower_bound(self, value: Any) -> int:
+        """Returns the index in sorted order of the first item not less than
+        the value.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            value (Any): The value to search for
+
+        Returns:
+            int: The index of the first item not less than the value
+        """
+        nodes, length = self.__nodes, self.__length
+
+        node = 1
+        while node <= length:
+            node = 2 * node + (nodes[node] < value)
+
+        return self.__ranks[Eytzinger.__last_left_turn(node)]
+
+    def upper_bound(self, value: Any) -> int:
+        """Returns the index in sorted order of the first item greater than
+        the value.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            value (Any): The value to search for
+
+        Returns:
+            int: The index of the first item greater than the value
+        """
+        nodes, length = self.__nodes, self.__length
+
+        node = 1
+        while node <= length:
+            node = 2 * node + (not value < nodes[node])
+
+        return self.__ranks[Eytzinger.__last_left_turn(node)]
+
+    def __contains__(self, value: Any) -> bool:
+        """Determines whether an item equal to the value is stored.
+
+        Time complexity: Θ(log(n))
+
+        Args:
+            value (Any): The value to search for
+
+        Returns:
+            bool: Whether an item equal to the value is stored
+        """
+        node, length = 1, self.__length
+        while node <= length:
+            node = 2 * node + (self.__nodes[node] < value)
+
+        node = Eytzinger.__last_left_turn(node)
+        return node != 0 and not value < self.__nodes[node]
+
+    def search_many(self, queries: Iterable, side: str = 'left') -> list:
+        """Returns the lower or upper bound of every query. Items and queries
+        that are all ints or all floats are searched for all queries at once
+        with NumPy, one tree level per step.
+
+        Time complexity: Θ(mlog(n)) for m queries
+
+        Args:
+            queries (Iterable): The values to search for
+            side (str, optional): 'left' for the first index not less than
+            each query, 'right' for the first index greater than it. Defaults
+            to 'left'.
+
+        Raises:
+            ValueError: The side is neither 'left' nor 'right'
+
+        Returns:
+            list: The index of every query, in the order of the queries
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+
+        bound = self.lower_bound if side == 'left' else self.upper_bound
+        queries = list(queries)
+        if self.__array is None or any(
+            type(query) is not self.__type for query in queries
+        ):
+            return [bound(query) for query in queries]
+
+        try:
+            queries = np.array(queries, dtype=self.__array.dtype)
+
+        except OverflowError:
+            return [bound(query) for query in queries]
+
+        nodes = np.ones(len(queries), dtype=np.int64)
+
+        for _ in range(self.__length.bit_length()):
+            inside = nodes <= self.__length
+            values = self.__array[np.minimum(nodes, self.__length) - 1]
+
+            right = values < queries if side == 'left' else values <= queries
+            nodes = np.where(inside, 2 * nodes + right, nodes)
+
+        # Strips the trailing right turns and the last left turn
+        turns = np.zeros_like(nodes)
+        while (odd := (nodes >> turns) & 1).any():
+            turns += odd
+
+        nodes >>= turns + 1
+        return self.__rank_array[nodes].tolist()
+
+    @staticmethod
+    def __last_left_turn(node: int) -> int:
+        """Returns the node where a search last went left, which holds the
+        first item past the searched value, given the index where the search
+        fell off the tree.
+
+        Args:
+            node (int): The index past the leaves where the search ended
+
+        Returns:
+            int: The node of the last left turn; 0 if the search only went
+            right
+        """
+        # Strips the trailing right turns and then the left turn itself
+        return node >> (node ^ (node + 1)).bit_length()
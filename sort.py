@@ -1,8 +1,79 @@
+from array import array
 from binary_search_tree import Tree
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from heap import Heap
+from heapq import merge
+from itertools import islice, repeat
 from math import log2
+from multiprocessing.shared_memory import SharedMemory
+from tempfile import TemporaryDirectory
+from typing import Any
+import logging
+import os
+import sys
+import tracemalloc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
 
 
 class Sort():
+    # Number of consecutive wins from one run before merging starts galloping
+    __MIN_GALLOP = 7
+
+    # Sublists of at most this length are finished with insertion sort
+    __INSERTION_CUTOFF = 16
+
+    # Number of children of every node of the heaps used by heapsort
+    __HEAP_ARITY = 4
+
+    # Sublists of at least this length pick a pivot from nine samples
+    __NINTHER_CUTOFF = 40
+
+    # NumPy sorting kinds matching the stability of each method
+    __NUMPY_KINDS = {
+        'sort': 'stable',
+        'bubble_sort': 'stable',
+        'selection_sort': 'quicksort',
+        'insertion_sort': 'stable',
+        'tree_sort': 'stable',
+        'heapsort': 'heapsort',
+        'quicksort': 'quicksort',
+        'three_way_quicksort': 'quicksort',
+        'merge_sort': 'stable',
+        'bottom_up_merge_sort': 'stable',
+        'adaptive_merge_sort': 'stable',
+    }
+
+    # Array typecodes that NumPy reads as numbers
+    __NUMERIC_TYPECODES = 'bBhHiIlLqQfd'
+
+    # Partitions that barely shrink the list before select gives up sampling
+    # pivots and uses the median of medians
+    __BAD_PARTITIONS = 4
+
+    # Sort.sort merges lists whose ascending runs are this long on average
+    __LONG_RUN = 32
+
+    # Sort.sort uses three-way partitioning above this ratio of duplicates
+    __DUPLICATE_RATIO = 0.5
+
+    # Number of items sampled by Sort.sort to estimate the duplicate ratio
+    __SAMPLE_SIZE = 64
+
+    # Counters reported by Sort.instrument and Sort.measure
+    __COUNTERS = (
+        'comparisons', 'swaps', 'moves', 'peak_memory', 'recursion_depth'
+    )
+
     @staticmethod
     def __swap(i: int, j: int, items: list):
         """Swaps elements of the specified list at the indices i and j.
@@ -15,7 +86,573 @@ class Sort():
         items[i], items[j] = items[j], items[i]
 
     @staticmethod
-    def bubble_sort(items: list):
+    def __dispatch(items, method, key, reverse: bool) -> bool:
+        """Sorts the items without the list-based engine of the method when 
+        they are a buffer, or when they are sorted by key or in reverse.
+
+        Args:
+            items (Any): The list or buffer to sort
+            method (function): The sorting method that was called
+            key (function): The function returning the key of an item; None to
+            compare the items themselves
+            reverse (bool): Whether to sort in descending order
+
+        Returns:
+            bool: Whether the items have been sorted
+        """
+        if Sort.__sort_buffer(items, method, key, reverse):
+            return True
+
+        if key is None and not reverse:
+            return False
+
+        # Counting and radix sort extract integer keys themselves
+        if not reverse and method in (Sort.counting_sort, Sort.radix_sort):
+            return False
+
+        Sort.__sort_keyed(items, method, key, reverse)
+        return True
+
+    @staticmethod
+    def __sort_keyed(items, method, key, reverse: bool, fast: bool = True):
+        """Sorts items by key with the decorate-sort-undecorate pattern. Every
+        key is computed once and paired with the index of its item, so the 
+        method only ever compares keys, ties are broken by position, and every
+        method becomes stable. Unless disabled, integer keys are sorted by 
+        counting or radix sort, and float keys by NumPy when it is installed,
+        since any stable sort gives the same result.
+
+        Time complexity: that of the method, plus Θ(n) calls to the key
+
+        Args:
+            items (Any): The list or buffer to sort
+            method (function): The sorting method used on the keys
+            key (function): The function returning the key of an item; None to
+            compare the items themselves
+            reverse (bool): Whether to sort in descending order
+            fast (bool, optional): Whether integer and float keys may bypass
+            the method. Defaults to True.
+        """
+        values = list(items)
+        length = len(values)
+        if length < 2:
+            return
+
+        keys = values if key is None else [key(item) for item in values]
+
+        if fast and all(type(item_key) is int for item_key in keys):
+            order = list(range(length))
+            fast_method = (
+                Sort.counting_sort if max(keys) - min(keys) <= 2 * length 
+                else Sort.radix_sort
+            )
+            fast_method(
+                order, 
+                (lambda index: -keys[index]) if reverse else keys.__getitem__
+            )
+
+        elif fast and np is not None and all(
+            type(item_key) is float for item_key in keys
+        ):
+            float_keys = np.array(keys)
+            order = np.argsort(
+                -float_keys if reverse else float_keys, kind='stable'
+            ).tolist()
+
+        else:
+            # Negated indices reverse the order of ties, which is undone when
+            # the whole list is reversed
+            decorated = [
+                (item_key, -index if reverse else index) 
+                for index, item_key in enumerate(keys)
+            ]
+            method(decorated)
+
+            if reverse:
+                decorated.reverse()
+
+            order = [abs(index) for _, index in decorated]
+
+        values = [values[index] for index in order]
+        Sort.__write_back(items, values)
+
+    @staticmethod
+    def numeric_view(items: Any) -> Any:
+        """Returns a NumPy array sharing the memory of a numeric buffer, so
+        that vectorized operations on it change the buffer itself.
+
+        Args:
+            items (Any): The list or buffer to view
+
+        Returns:
+            Any: The NumPy array viewing the items; None if NumPy is not
+            installed or the items are not a numeric buffer
+        """
+        if np is None:
+            return None
+
+        if isinstance(items, np.ndarray):
+            return items if items.dtype.kind in 'iuf' else None
+
+        if isinstance(items, array) and (
+            items.typecode in Sort.__NUMERIC_TYPECODES
+        ):
+            return np.frombuffer(items, dtype=items.typecode)
+
+        return None
+
+    @staticmethod
+    def __write_back(items, values: list):
+        """Copies sorted values back into the list or buffer they were taken
+        from.
+
+        Args:
+            items (Any): The list or buffer to overwrite
+            values (list): The values to copy, as many as there are items
+        """
+        items[:] = (
+            array(items.typecode, values) if isinstance(items, array) 
+            else values
+        )
+
+    @staticmethod
+    def __sort_buffer(items, method, key=None, reverse: bool = False) -> bool:
+        """Sorts NumPy arrays and array.array buffers in place on the caller's
+        memory. Numeric buffers are sorted with vectorized NumPy operations; 
+        buffers of other items, or any buffer when NumPy is not installed, are
+        copied into a list, sorted by the method and copied back.
+
+        Args:
+            items (Any): The list or buffer to sort
+            method (function): The sorting method that was called
+            key (function, optional): The function returning the key of an 
+            item. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order.
+            Defaults to False.
+
+        Raises:
+            ValueError: The NumPy array is not one-dimensional
+
+        Returns:
+            bool: Whether the items were a buffer and have been sorted
+        """
+        if np is not None and isinstance(items, np.ndarray):
+            if items.ndim != 1:
+                raise ValueError('only one-dimensional arrays can be sorted')
+
+        elif not isinstance(items, array):
+            return False
+
+        if len(items) < 2:
+            return True
+
+        view = Sort.numeric_view(items) if key is None else None
+        if view is None:
+            values = items.tolist()
+            method(values, key=key, reverse=reverse)
+            Sort.__write_back(items, values)
+
+            return True
+
+        # Sorting the reversed items ascending and reversing the result sorts
+        # them descending while keeping equal items in their original order
+        if reverse:
+            view[:] = view[::-1].copy()
+
+        if method.__name__ == 'counting_sort':
+            Sort.__numpy_counting_sort(view)
+
+        elif method.__name__ == 'radix_sort':
+            Sort.__numpy_radix_sort(view)
+
+        else:
+            view.sort(kind=Sort.__NUMPY_KINDS[method.__name__])
+
+        if reverse:
+            view[:] = view[::-1].copy()
+
+        return True
+
+    @staticmethod
+    def __numpy_counting_sort(view):
+        """Performs counting sort on a NumPy array of integers in place by 
+        counting every value with np.bincount and writing each value back as
+        many times as it was counted.
+
+        Time complexity: Θ(n + k) where k is the range of item values
+
+        Args:
+            view (np.ndarray): The array to sort
+
+        Raises:
+            TypeError: The array does not contain integers
+        """
+        if view.dtype.kind not in 'biu':
+            raise TypeError('counting sort requires integers')
+
+        low, high = int(view.min()), int(view.max())
+        counts = np.bincount(view.astype(np.intp) - low)
+
+        view[:] = np.repeat(np.arange(low, high + 1), counts)
+
+    @staticmethod
+    def __numpy_radix_sort(view):
+        """Performs LSD radix sort on a NumPy array of numbers in place. The 
+        bits of each item are mapped to an unsigned integer with the same 
+        order, then each byte is sorted with a stable counting pass over 
+        8-bit digits. Passes where every digit is equal are skipped.
+
+        Time complexity: Θ(d(n + b)) where d is the item size in bytes and
+        b = 256
+
+        Args:
+            view (np.ndarray): The array to sort
+        """
+        size = view.dtype.itemsize
+        unsigned = np.dtype(f'u{size}')
+        sign = unsigned.type(1 << (8 * size - 1))
+
+        # Flips the sign bit of integers, and every bit of negative floats,
+        # so that unsigned order matches numeric order
+        bits = view.view(unsigned)
+        if view.dtype.kind == 'i':
+            keys = bits ^ sign
+
+        elif view.dtype.kind == 'f':
+            keys = np.where(bits & sign, ~bits, bits | sign)
+
+        else:
+            keys = bits.copy()
+
+        values = view.copy()
+        for shift in range(0, 8 * size, 8):
+            digits = (keys >> unsigned.type(shift)).astype(np.uint8)
+
+            counts = np.bincount(digits, minlength=256)
+            if counts.max() == len(digits):
+                continue
+
+            order = np.argsort(digits, kind='stable')
+            keys, values = keys[order], values[order]
+
+        view[:] = values
+
+    @staticmethod
+    def sort(items: list, key=None, reverse: bool = False):
+        """Sorts the specified list with the engine best suited to it. Modifies
+        original list.<br>
+        Profiles the list in one pass for its length, number of ascending 
+        runs, item types and integer range, and samples it for duplicates. 
+        Then it uses insertion sort for tiny lists, adaptive merge sort for
+        lists made of long runs, counting sort for integers of a small range, 
+        radix sort for other integers, three-way quicksort for lists with many
+        duplicates, and quicksort otherwise. Every decision is logged at the
+        DEBUG level.<br>
+        Buffers, and lists sorted by key or in reverse, are sorted the way
+        every other method sorts them, with this method choosing the engine for
+        the values or keys that remain to be compared.
+
+        Stable only for the engines that are stable; always stable when sorted
+        by key or in reverse
+
+        Time complexity:
+        <li>O(nlg(n)) worst case</li>
+        <li>Θ(n) best case (already sorted)</li>
+
+        Memory space: that of the chosen engine
+
+        Args:
+            items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.sort, key, reverse):
+            return
+
+        if len(items) < 2:
+            return
+
+        method = Sort.__choose_engine(items)
+        if method is not None:
+            method(items)
+
+    @staticmethod
+    def __choose_engine(items: list) -> Any:
+        """Profiles a list of at least two items and chooses the engine 
+        Sort.sort uses for it, logging the decision.
+
+        Args:
+            items (list): The list to sort
+
+        Returns:
+            Any: The sorting method; None if the list is already sorted
+        """
+        length = len(items)
+        profile = Sort.__profile(items)
+        runs, kind = profile['runs'], profile['type']
+
+        if length <= Sort.__INSERTION_CUTOFF:
+            method = Sort.insertion_sort
+
+        elif runs == 1:
+            method = None
+
+        elif runs == length or runs <= length // Sort.__LONG_RUN:
+            method = Sort.adaptive_merge_sort
+
+        elif kind == 'int' and profile['high'] - profile['low'] <= 2 * length:
+            method = Sort.counting_sort
+
+        elif kind == 'int':
+            method = Sort.radix_sort
+
+        elif profile['duplicates'] >= Sort.__DUPLICATE_RATIO:
+            method = Sort.three_way_quicksort
+
+        else:
+            method = Sort.quicksort
+
+        logger.debug(
+            'sort: length %d, %d runs, %.0f%% duplicates, %s items%s -> %s',
+            length,
+            runs,
+            100 * profile['duplicates'],
+            kind,
+            f' in [{profile["low"]}, {profile["high"]}]' if kind == 'int' 
+            else '',
+            method.__name__ if method else 'already sorted',
+        )
+
+        return method
+
+    @staticmethod
+    def __profile(items: list) -> dict:
+        """Profiles a list for Sort.sort. The number of ascending runs, the 
+        item types and the lowest and highest item are found in one pass, and
+        the duplicate ratio is estimated from equal neighbours in a sorted 
+        sample of evenly spaced items.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (list): The list to profile
+
+        Returns:
+            dict: The number of runs, the name of the item type ('mixed' if 
+            the items have different types), the duplicate ratio, and the 
+            lowest and highest item if they are integers
+        """
+        runs = 1
+        previous = low = high = items[0]
+        item_type = type(previous)
+        mixed = False
+        for item in items:
+            # A new lowest item is always below its neighbour, and a new 
+            # highest item above it, so each needs one more comparison
+            if item < previous:
+                runs += 1
+                if item < low:
+                    low = item
+
+            elif high < item:
+                high = item
+
+            if type(item) is not item_type:
+                mixed = True
+
+            previous = item
+
+        kind = 'mixed' if mixed else item_type.__name__
+
+        sample = sorted(items[::max(1, len(items) // Sort.__SAMPLE_SIZE)])
+        duplicates = sum(
+            1 for i in range(1, len(sample)) if not sample[i - 1] < sample[i]
+        )
+
+        profile = {
+            'runs': runs,
+            'type': kind,
+            'duplicates': duplicates / len(sample),
+        }
+
+        if kind == 'int':
+            profile['low'], profile['high'] = low, high
+
+        return profile
+
+    @staticmethod
+    def resort(items: list, dirty=None, key=None, reverse: bool = False):
+        """Sorts a list that was sorted before some of its items changed. 
+        Modifies original list.<br>
+        Only the dirty items are sorted, with Sort.sort, and they are then 
+        merged into the clean items: each dirty item is placed with a binary
+        search that starts where the previous one ended, and the clean items 
+        between them are copied as whole slices. Clean items are placed before
+        dirty items they are equal to.
+
+        Not in-place, stable for the clean items
+
+        Time complexity: O(n + dlg(n)) where d is the number of dirty items<br>
+        Memory space: Θ(n)
+
+        Args:
+            items (list): The list to sort, whose clean items are in sorted 
+            order
+            dirty (int | Iterable, optional): The start index of an unsorted 
+            tail appended to a sorted list, or the indices of the items that
+            changed; None to treat everything after the longest sorted prefix
+            as dirty. Defaults to None.
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether the list is sorted in descending
+            order. Defaults to False.
+
+        Raises:
+            IndexError: A dirty index is out of range
+        """
+        length = len(items)
+        if isinstance(items, array) or (
+            np is not None and isinstance(items, np.ndarray)
+        ):
+            Sort.__resort_buffer(items, dirty, key, reverse)
+            return
+
+        keys = items if key is None else [key(item) for item in items]
+        if dirty is None:
+            dirty = 1
+            while dirty < length and not (
+                keys[dirty] > keys[dirty - 1] if reverse 
+                else keys[dirty] < keys[dirty - 1]
+            ):
+                dirty += 1
+
+        if isinstance(dirty, int):
+            dirty = range(dirty, length) if dirty >= 0 else range(
+                max(length + dirty, 0), length
+            )
+
+        indices = Sort.__dirty_indices(dirty, length)
+        if not indices:
+            return
+
+        clean, clean_keys, changed, previous = [], [], [], 0
+        for index in indices:
+            clean += items[previous:index]
+            clean_keys += keys[previous:index]
+            changed.append(items[index])
+            previous = index + 1
+
+        clean += items[previous:]
+        clean_keys += keys[previous:]
+
+        Sort.sort(changed, key, reverse)
+
+        # Equal clean items are placed first, which in descending order means
+        # searching for the dirty key from the right of the reversed keys
+        if reverse:
+            clean.reverse()
+            clean_keys.reverse()
+            changed.reverse()
+
+        bisect = bisect_left if reverse else bisect_right
+        result, position = [], 0
+        for item in changed:
+            split = bisect(
+                clean_keys, item if key is None else key(item), position
+            )
+
+            result += clean[position:split]
+            result.append(item)
+            position = split
+
+        result += clean[position:]
+
+        if reverse:
+            result.reverse()
+
+        items[:] = result
+
+    @staticmethod
+    def __dirty_indices(dirty: Iterable, length: int) -> list:
+        """Returns the distinct dirty indices of a list in ascending order, 
+        with negative indices counted from the end.
+
+        Args:
+            dirty (Iterable): The dirty indices
+            length (int): The length of the list
+
+        Raises:
+            IndexError: A dirty index is out of range
+
+        Returns:
+            list: The dirty indices in ascending order
+        """
+        # Ranges already in bounds are ascending and distinct
+        if isinstance(dirty, range) and dirty.step == 1 and (
+            0 <= dirty.start <= dirty.stop <= length
+        ):
+            return dirty
+
+        indices = set()
+        for index in dirty:
+            if not -length <= index < length:
+                raise IndexError('resort index out of range')
+
+            indices.add(index % length)
+
+        return sorted(indices)
+
+    @staticmethod
+    def __resort_buffer(items, dirty, key, reverse: bool):
+        """Re-sorts a buffer. Numeric buffers are merged with NumPy, finding
+        the positions of all sorted dirty items in the clean items with 
+        searchsorted and inserting them at once; other buffers are copied 
+        into a list, re-sorted and copied back.
+
+        Args:
+            items (Any): The buffer to sort
+            dirty (int | Iterable): The dirty tail start or indices; None to
+            detect the sorted prefix
+            key (function): The function returning the key of an item; None to
+            compare the items themselves
+            reverse (bool): Whether the buffer is sorted in descending order
+        """
+        view = Sort.numeric_view(items)
+        if view is None or key is not None or dirty is None:
+            values = items.tolist()
+            Sort.resort(values, dirty, key, reverse)
+            Sort.__write_back(items, values)
+
+            return
+
+        length = len(view)
+        if isinstance(dirty, int):
+            dirty = range(dirty, length) if dirty >= 0 else range(
+                max(length + dirty, 0), length
+            )
+
+        mask = np.ones(length, dtype=bool)
+        mask[list(Sort.__dirty_indices(dirty, length))] = False
+
+        clean = view[mask]
+        changed = np.sort(view[~mask])
+
+        # Equal numbers are interchangeable, so the dirty items only need to
+        # be ascending to merge into the reversed clean items
+        if reverse:
+            clean = clean[::-1]
+
+        positions = np.searchsorted(
+            clean, changed, 'left' if reverse else 'right'
+        )
+        merged = np.insert(clean, positions, changed)
+
+        view[:] = merged[::-1] if reverse else merged
+
+    @staticmethod
+    def bubble_sort(items: list, key=None, reverse: bool = False):
         """Performs bubble sort on the specified list. Modifies original list.
         <br>
         Continuously iterates through the list and swaps adjacent item pairs
@@ -31,7 +668,14 @@ class Sort():
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
+        if Sort.__dispatch(items, Sort.bubble_sort, key, reverse):
+            return
+
         # Keeps iterating until the list has no more items needed to swap
         swapped = True
         while swapped:
@@ -44,7 +688,7 @@ class Sort():
                     swapped = True
 
     @staticmethod
-    def selection_sort(items: list):
+    def selection_sort(items: list, key=None, reverse: bool = False):
         """Performs selection sort on the specified list. Modifies original 
         list.<br>
         Continuously iterates through the list and swaps the end of a growing
@@ -57,7 +701,14 @@ class Sort():
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
+        if Sort.__dispatch(items, Sort.selection_sort, key, reverse):
+            return
+
         for i in range(len(items) - 1):
             # Finds smallest index
             min_index = i
@@ -69,7 +720,7 @@ class Sort():
             Sort.__swap(i, min_index, items)
 
     @staticmethod
-    def insertion_sort(items: list):
+    def insertion_sort(items: list, key=None, reverse: bool = False):
         """Performs insertion sort on the specified list. Modifies original 
         list.<br>
         Iterates through the list and inserts each item into a growing 
@@ -85,40 +736,77 @@ class Sort():
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.insertion_sort, key, reverse):
+            return
+
+        Sort.__insertion_sort(items, 0, len(items))
+
+    @staticmethod
+    def __insertion_sort(items: list, start: int, stop: int):
+        """Performs insertion sort on a sublist. Each item is shifted into 
+        place by moving the larger items of the sorted sublist one position to
+        the right.
+
+        Time complexity:
+        <li>Θ(n^2) worst/average case</li>
+        <li>Θ(n) best case (already sorted)</li>
+
+        Args:
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, exclusive
         """
-        for i in range(1, len(items)):
+        for i in range(start + 1, stop):
+            item = items[i]
+
             j = i
-            while j > 0 and items[j] < items[j - 1]:
-                Sort.__swap(j, j - 1, items)
+            while j > start and item < items[j - 1]:
+                items[j] = items[j - 1]
                 j -= 1
 
+            items[j] = item
+
     @staticmethod
-    def tree_sort(items: list):
+    def tree_sort(items: list, key=None, reverse: bool = False):
         """Performs tree sort on a specified list. Modifies original list.<br>
         Iterates through the tree using in-order depth-first search and copies 
         the items in sorted order into the original list.
 
         Comparision sort, not in-place, stable
 
-        Time complexity:
-        <li>Θ(n^2) worst case (already sorted)</li>
-        <li>Θ(nlg(n)) average/best case</li>
-
+        Time complexity: Θ(nlg(n)) all cases (self-balancing tree)<br>
         Memory space: Θ(n)
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
-        tree = Tree(items)
-        items[:] = tree.values()
+        if Sort.__dispatch(items, Sort.tree_sort, key, reverse):
+            return
+
+        tree = Tree(balanced=True)
+        for item in items:
+            tree.add(item)
+
+        items[:] = tree
         del tree
 
     @staticmethod
-    def heapsort(items: list):
+    def heapsort(items: list, key=None, reverse: bool = False):
         """Peforms heapsort on a specified list. Modifies original list.<br>
-        Transforms an unordered list into a max heap and continuously removes
-        the top of the max heap to insert into the end of the list. Does not
-        effectively use cashing.
+        Transforms an unordered list into a 4-ary min heap and continuously 
+        moves the top of the heap to its end, then reverses the list. A 4-ary
+        heap is half as deep as a binary heap and keeps the children of a node
+        next to each other, and each removal sifts a hole down to a leaf 
+        before placing the moved item, which saves comparisons.
 
         Comparision sort, in-place, unstable
 
@@ -130,224 +818,1978 @@ class Sort():
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
+        if Sort.__dispatch(items, Sort.heapsort, key, reverse):
+            return
 
-        # Converts list into max heap
-        heap_end = len(items) - 1
-        for i in range(heap_end // 2, -1, -1):
-            Sort.__heapify(i, heap_end, items)
-
-        # Continuously removes items from max heap
-        while heap_end > 0:
-            Sort.__swap(0, heap_end, items)
-            Sort.__heapify(0, heap_end, items)
-            heap_end -= 1
+        Sort.__heapsort(items, 0, len(items))
 
     @staticmethod
-    def __heapify(index, heap_end, items: list):
-        """Converts a sublist into a max heap.
-        Assuming the left and right subtrees of a node at the index are max
-        heaps, convert the tree starting from the node into a max heap.
+    def __heapsort(items: list, start: int, stop: int):
+        """Performs heapsort on a sublist.<br>
+        Builds a min heap and moves its smallest item to the end of the heap
+        until it is empty, which leaves the sublist in descending order, and
+        then reverses it.
 
-        Time complexity: Θ(lgn)
+        Time complexity: Θ(nlg(n)) worst/average case
 
         Args:
-            index (integer): The index of the root of the tree
-            heap_end (integer): The length of a list representing a heap
-            items (list): The list representing a heap
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, exclusive
         """
-        current = index
-        while current < heap_end:
-            max_child = left = current * 2 + 1
-            right = current * 2 + 2
-
-            # Selects the larger of its two children, if any
-            if right < heap_end and items[right] > items[left]:
-                max_child = right
+        arity = Sort.__HEAP_ARITY
+        Heap.build(items, start, stop, arity)
 
-            # Checks if the parent is larger than the child
-            if max_child < heap_end and items[max_child] > items[current]:
-                Sort.__swap(current, max_child, items)
+        for heap_end in range(stop - 1, start, -1):
+            items[start], items[heap_end] = items[heap_end], items[start]
+            Heap.sift_down(items, 0, start, heap_end, arity)
 
-            current = max_child
+        left, right = start, stop - 1
+        while left < right:
+            items[left], items[right] = items[right], items[left]
+            left += 1
+            right -= 1
 
     @staticmethod
-    def quicksort(items: list):
-        """Performs quicksort on the specified list. Modifies original list.<br>
-        Partitions a list using the last element as a pivot key where 
-        - elements to the left of the pivot are less than and equal to the pivot
-        - elements to the right of the pivot
+    def quicksort(items: list, key=None, reverse: bool = False):
+        """Performs introsort on the specified list. Modifies original list.<br>
+        Partitions a list with Hoare's scheme around the median of three (or 
+        of nine, for long sublists) sampled items where
+        - elements of the left part are less than or equal to the pivot
+        - elements of the right part are greater than or equal to the pivot
+
+        The smaller part is partitioned next while the larger one waits on an
+        explicit stack. Sublists that take more than 2lg(n) partitions are 
+        heapsorted instead, and short sublists are insertion sorted.
 
         Comparision sort, in-place, unstable
 
-        Time complexity:
-        <li>Θ(n^2) worst case</li>
-        <li>Θ(nlg(n)) average/best case</li>
+        Time complexity: Θ(nlg(n)) all cases<br>
+        Memory space: Θ(lg(n))
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
-        Sort.__quicksort(items, 0, len(items) - 1)
-    
-    @staticmethod
-    def __quicksort(items: list, start: int, stop: int):
-        """Performs quicksort on the specified list. Modifies original list.<br>
-        Partitions a list using the last element as a pivot key where 
-        - elements to the left of the pivot are less than and equal to the pivot
-        - elements to the right of the pivot
+        if Sort.__dispatch(items, Sort.quicksort, key, reverse):
+            return
 
-        Comparision sort, in-place, unstable
+        Sort.__introsort(items, 0, len(items))
 
-        Time complexity:
-        <li>Θ(n^2) worst case</li>
-        <li>Θ(nlg(n)) average/best case</li>
+    @staticmethod
+    def __introsort(items: list, start: int, stop: int):
+        """Performs introsort on a sublist.
+
+        Time complexity: Θ(nlg(n)) all cases
 
         Args:
-            items (list): The list to sort
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, exclusive
         """
-        if start >= stop:
+        if stop - start < 2:
             return
 
-        pivot_index = Sort.__lomuto_partition(items, start, stop)
+        depth_limit = 2 * int(log2(stop - start))
+        stack = [(start, stop - 1, depth_limit)]
 
-        Sort.__quicksort(items, start, pivot_index - 1)
-        Sort.__quicksort(items, pivot_index + 1, stop)
-
-    @staticmethod
-    def __lomuto_partition(items: list, start: int, stop: int) -> int:
-        """Splits a list into two halves.<br>
-        Using the last element as a pivot, a list is bisected so that 
-        - elements left of the pivot are smaller than or equal to it
-        - elements right of the pivot are larger than it
+        while stack:
+            start, stop, depth = stack.pop()
 
-        Time complexity: Θ(n)
+            while stop - start + 1 > Sort.__INSERTION_CUTOFF:
+                # Partitioning is going badly, so heapsort guarantees nlg(n)
+                if depth == 0:
+                    Sort.__heapsort(items, start, stop + 1)
+                    break
 
-        Args:
-            items (list): The list to bisect
-            start (int): The start index of the sublist of the list
-            stop (int): The stop index of the sublist of the list
+                depth -= 1
+                split = Sort.__hoare_partition(items, start, stop)
 
-        Returns:
-            int: The pivot index of quicksort
-        """
+                # Saves the larger part for later so the stack stays small
+                if split - start < stop - split:
+                    stack.append((split + 1, stop, depth))
+                    stop = split
 
-        pivot_key = items[stop]
-        pivot_index = start
+                else:
+                    stack.append((start, split, depth))
+                    start = split + 1
 
-        for inversion_index in range(start, stop):
-            if items[inversion_index] <= pivot_key:
-                Sort.__swap(pivot_index, inversion_index, items)
-                pivot_index += 1
+            else:
+                Sort.__insertion_sort(items, start, stop + 1)
 
-        Sort.__swap(pivot_index, stop, items)
-        return pivot_index
-    
     @staticmethod
-    def __hoare_partition(items: list, start: int, stop: int) -> int:
-         pass
+    def three_way_quicksort(items: list, key=None, reverse: bool = False):
+        """Performs three-way quicksort on the specified list. Modifies 
+        original list.<br>
+        Partitions a list around a pivot into three parts, as in the Dutch 
+        national flag problem, where
+        - elements of the left part are less than the pivot
+        - elements of the middle part are equal to the pivot
+        - elements of the right part are greater than the pivot
 
-    @staticmethod
-    def merge_sort(items: list):
-        """Performs merge sort on a specified list. Modifies original list.<br>
-        Uses divide and conquer by continuously halfing the list into n sublists
-        before merging them together in sorted order.  
+        The middle part is already in place, so every key is finished by the
+        first partition that uses it as a pivot. Like quicksort, the larger
+        outer part waits on an explicit stack and sublists fall back to 
+        heapsort or insertion sort.
 
-        Comparision sort, not in-place, stable
+        Comparision sort, in-place, unstable
 
-        Time complexity: Θ(nlg(n)) all cases
-        Memory space: Θ(n)
+        Time complexity: 
+        <li>Θ(nlg(n)) worst/average case</li>
+        <li>Θ(nlg(k)) with k distinct keys</li>
+        <li>Θ(n) best case (all elements are identical)</li>
+
+        Memory space: Θ(lg(n))
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
-        items[:] = Sort.__merge_sort(items)
+        if Sort.__dispatch(items, Sort.three_way_quicksort, key, reverse):
+            return
 
-    @staticmethod
-    def __merge_sort(items: list) -> list:
-        """Performs merge sort on a specified list and returns a new list. Does
-        not modify the original list.<br>
-        Uses divide and conquer by continuously halfing the list into n sublists
-        before merging them together in sorted order.  
+        length = len(items)
+        if length < 2:
+            return
 
-        Comparision sort, not in-place, stable
+        depth_limit = 2 * int(log2(length))
+        stack = [(0, length - 1, depth_limit)]
 
-        Time complexity: Θ(nlg(n)) all cases
-        Memory space: Θ(n)
+        while stack:
+            start, stop, depth = stack.pop()
+
+            while stop - start + 1 > Sort.__INSERTION_CUTOFF:
+                if depth == 0:
+                    Sort.__heapsort(items, start, stop + 1)
+                    break
+
+                depth -= 1
+                less, greater = Sort.__three_way_partition(items, start, stop)
+
+                # Saves the larger outer part for later
+                if less - start < stop - greater:
+                    stack.append((greater + 1, stop, depth))
+                    stop = less - 1
+
+                else:
+                    stack.append((start, less - 1, depth))
+                    start = greater + 1
+
+            else:
+                Sort.__insertion_sort(items, start, stop + 1)
+
+    @staticmethod
+    def __three_way_partition(items: list, start: int, stop: int) -> tuple:
+        """Splits a list into three parts.<br>
+        Using the median of sampled elements as a pivot, elements are swapped 
+        toward both ends in a single pass so that
+        - elements of the left part are smaller than the pivot
+        - elements of the middle part are equal to the pivot
+        - elements of the right part are larger than the pivot
+
+        Time complexity: Θ(n)
 
         Args:
-            items (list): The list to sort
+            items (list): The list to split
+            start (int): The start index of the sublist of the list
+            stop (int): The stop index of the sublist of the list, inclusive
 
         Returns:
-            list: The left and right halfs of the list combined into a sorted
-            list
+            tuple: The start and stop indices of the middle part, inclusive
         """
-        if len(items) > 1:
-            mid = len(items) // 2
+        Sort.__swap(start, Sort.__choose_pivot(items, start, stop), items)
+        pivot_key = items[start]
+
+        less, index, greater = start, start + 1, stop
+        while index <= greater:
+            if items[index] < pivot_key:
+                Sort.__swap(less, index, items)
+                less += 1
+                index += 1
 
-            left = Sort.__merge_sort(items[:mid])
-            right = Sort.__merge_sort(items[mid:])
+            elif items[index] > pivot_key:
+                Sort.__swap(index, greater, items)
+                greater -= 1
 
-            items = Sort.__merge(left, right)
-            print(items)
+            else:
+                index += 1
 
-        return items
+        return less, greater
 
     @staticmethod
-    def __merge(left: list, right: list) -> list:
-        """Merges two lists together in sorted order.
+    def __hoare_partition(
+        items: list, 
+        start: int, 
+        stop: int, 
+        pivot: int = None
+    ) -> int:
+        """Splits a list into two parts.<br>
+        Using the median of sampled elements as a pivot, two indices move
+        toward each other from both ends and swap misplaced elements so that
+        - elements of the left part are smaller than or equal to the pivot
+        - elements of the right part are larger than or equal to the pivot
+
+        Equal elements are split evenly between both parts.
 
         Time complexity: Θ(n)
-        Memory space: Θ(n)
 
         Args:
-            left (list): One of the two lists to combine
-            right (list): One of the two lists to combine
+            items (list): The list to split
+            start (int): The start index of the sublist of the list
+            stop (int): The stop index of the sublist of the list, inclusive
+            pivot (int, optional): The index of the pivot; None to sample one.
+            Defaults to None.
 
         Returns:
-            list: A combined list of the two specified left and right lists in
-            sorted order
+            int: The stop index of the left part, which is never empty
         """
-        left_index = 0
+        if pivot is None:
+            pivot = Sort.__choose_pivot(items, start, stop)
 
-        while right:
-            if left_index >= len(left) or right[0] < left[left_index]:
-                left.insert(left_index, right.pop(0))
+        mid = (start + stop) // 2
+        Sort.__swap(mid, pivot, items)
+        pivot_key = items[mid]
 
-            left_index += 1
+        left, right = start - 1, stop + 1
+        while True:
+            left += 1
+            while items[left] < pivot_key:
+                left += 1
 
-        del right
-        return left
+            right -= 1
+            while items[right] > pivot_key:
+                right -= 1
 
-    @staticmethod
-    def counting_sort(items: list):
-        """Performs counting sort on a specified list. Modifies original list.
-        <br>
+            if left >= right:
+                return right
 
-        Linear sort, not in-place, stable
+            Sort.__swap(left, right, items)
 
-        Time complexity: Θ(n + k) all cases where k is the range of item values
+    @staticmethod
+    def __choose_pivot(items: list, start: int, stop: int) -> int:
+        """Selects the index of a pivot from a sublist using the median of the
+        first, middle and last items, or Tukey's ninther (the median of three
+        medians of three) for long sublists.
 
         Args:
-            items (list): The list to sort
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, inclusive
+
+        Returns:
+            int: The index of the pivot
         """
-        pass
+        mid = (start + stop) // 2
+        if stop - start + 1 < Sort.__NINTHER_CUTOFF:
+            return Sort.__median_of_three(items, start, mid, stop)
+
+        step = (stop - start) // 8
+        return Sort.__median_of_three(
+            items,
+            Sort.__median_of_three(items, start, start + step, start + 2 * step),
+            Sort.__median_of_three(items, mid - step, mid, mid + step),
+            Sort.__median_of_three(items, stop - 2 * step, stop - step, stop)
+        )
 
     @staticmethod
-    def radix_sort(items: list):
-        """Performs radix sort on a specified list of integers. Modifies
-        original list.<br>
-        Sorts digits by their least significant digit to their most 
-        significant digit.
+    def __median_of_three(items: list, a: int, b: int, c: int) -> int:
+        """Returns the index of the median of the items at three indices.
 
-        Linear sort, in-place, stable
+        Args:
+            items (list): The list containing the items
+            a (int): The index of the first item
+            b (int): The index of the second item
+            c (int): The index of the third item
 
-        Time complexity: Θ(n)
+        Returns:
+            int: The index of the median item
+        """
+        if items[a] < items[b]:
+            if items[b] < items[c]:
+                return b
+
+            return c if items[a] < items[c] else a
+
+        if items[a] < items[c]:
+            return a
+
+        return c if items[b] < items[c] else b
+
+    @staticmethod
+    def select(items: list, k: int, key=None, reverse: bool = False) -> Any:
+        """Returns the item at position k of the list in sorted order without
+        sorting or modifying the list.<br>
+        Runs Sort.nth_element on a copy of the list.
+
+        Time complexity: Θ(n) worst/average case<br>
+        Memory space: Θ(n)
+
+        Args:
+            items (list): The list to select from
+            k (int): The position of the item in sorted order; negative 
+            positions count from the end
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to count positions in descending
+            order. Defaults to False.
+
+        Raises:
+            IndexError: The position is out of range
+
+        Returns:
+            Any: The item at position k in sorted order
+        """
+        values = list(items)
+        Sort.nth_element(values, k, key, reverse)
+
+        return values[k]
+
+    @staticmethod
+    def nth_element(items: list, k: int, key=None, reverse: bool = False):
+        """Rearranges the specified list so the item at position k is the one
+        that would be there if the list were sorted, every item before it is 
+        less than or equal to it, and every item after it is greater than or 
+        equal to it. Modifies original list.<br>
+        Performs introselect: quickselect keeps partitioning the part holding 
+        position k with Hoare's scheme, and switches to the median of medians
+        as the pivot if partitions repeatedly fail to shrink the part.
+
+        Selection, in-place, unstable
+
+        Time complexity: Θ(n) worst/average case<br>
+        Memory space: O(lg(n))
+
+        Args:
+            items (list): The list to rearrange
+            k (int): The position in sorted order; negative positions count
+            from the end
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to count positions in descending
+            order. Defaults to False.
+
+        Raises:
+            IndexError: The position is out of range
+        """
+        Sort.__select(items, k, key, reverse, False)
+
+    @staticmethod
+    def partial_sort(items: list, k: int, key=None, reverse: bool = False):
+        """Moves the k smallest items of the specified list to its front in 
+        sorted order, leaving the other items after them in no particular 
+        order. Modifies original list.<br>
+        Selects the item at position k - 1 with Sort.nth_element, then sorts
+        the items before it with introsort.
+
+        Selection, in-place, unstable
+
+        Time complexity: O(n + klg(k))<br>
+        Memory space: O(lg(n))
+
+        Args:
+            items (list): The list to partially sort
+            k (int): The number of items to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to move the k largest items to 
+            the front in descending order instead. Defaults to False.
+        """
+        if k >= len(items):
+            Sort.quicksort(items, key, reverse)
+
+        elif k > 0:
+            Sort.__select(items, k - 1, key, reverse, True)
+
+    @staticmethod
+    def __select(items, k: int, key, reverse: bool, sort_front: bool):
+        """Moves the item at position k in sorted order into place, and sorts
+        the items before it if requested. Keys are computed once and paired 
+        with the index of their item, and buffers are rearranged as lists, or
+        with NumPy when they are numeric.
+
+        Args:
+            items (Any): The list or buffer to rearrange
+            k (int): The position in sorted order; negative positions count
+            from the end
+            key (function): The function returning the key of an item; None to
+            compare the items themselves
+            reverse (bool): Whether to count positions in descending order
+            sort_front (bool): Whether to sort the items before position k
+
+        Raises:
+            IndexError: The position is out of range
+        """
+        length = len(items)
+        if k < 0:
+            k += length
+
+        if not 0 <= k < length:
+            raise IndexError('select index out of range')
+
+        buffer = isinstance(items, array) or (
+            np is not None and isinstance(items, np.ndarray)
+        )
+
+        view = Sort.numeric_view(items) if key is None else None
+        if view is not None:
+            # Ascending position of the item at descending position k
+            target = length - 1 - k if reverse else k
+            view.partition(target)
+
+            if sort_front:
+                front = view[target:] if reverse else view[:target + 1]
+                front.sort()
+
+            if reverse:
+                view[:] = view[::-1].copy()
+
+            return
+
+        if buffer or key is not None:
+            values = list(items)
+            entries = values if key is None else [
+                (key(value), index) for index, value in enumerate(values)
+            ]
+
+        else:
+            entries = items
+
+        target = length - 1 - k if reverse else k
+        Sort.__quickselect(entries, 0, length - 1, target)
+
+        if sort_front:
+            if reverse:
+                Sort.__introsort(entries, target, length)
+
+            else:
+                Sort.__introsort(entries, 0, target + 1)
+
+        if reverse:
+            entries.reverse()
+
+        if entries is items:
+            return
+
+        if key is not None:
+            values = [values[index] for _, index in entries]
+
+        Sort.__write_back(items, values)
+
+    @staticmethod
+    def __quickselect(items: list, start: int, stop: int, k: int):
+        """Performs introselect on a sublist so that the item at index k is 
+        the one that would be there if the sublist were sorted.<br>
+        Partitions that leave more than three quarters of the part holding
+        index k use up a small budget. Once it runs out, every pivot is the 
+        median of medians, which always discards at least 30% of the part, so 
+        the total work stays linear.
+
+        Time complexity: Θ(n) worst/average case
+
+        Args:
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, inclusive
+            k (int): The index to select, between start and stop
+        """
+        bad_partitions = Sort.__BAD_PARTITIONS
+        while stop - start + 1 > Sort.__INSERTION_CUTOFF:
+            length = stop - start + 1
+            pivot = Sort.__median_of_medians(
+                items, start, stop
+            ) if bad_partitions == 0 else None
+
+            split = Sort.__hoare_partition(items, start, stop, pivot)
+            if k <= split:
+                stop = split
+
+            else:
+                start = split + 1
+
+            if bad_partitions and 4 * (stop - start + 1) > 3 * length:
+                bad_partitions -= 1
+
+        Sort.__insertion_sort(items, start, stop + 1)
+
+    @staticmethod
+    def __median_of_medians(items: list, start: int, stop: int) -> int:
+        """Returns the index of the median of the medians of groups of five 
+        items of a sublist. The medians are moved to the front of the sublist
+        and their median is found with Sort.__quickselect.
+
+        Time complexity: Θ(n)
+
+        Args:
+            items (list): The list containing the sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, inclusive
+
+        Returns:
+            int: The index of the median of medians
+        """
+        medians = start
+        for group in range(start, stop + 1, 5):
+            group_stop = min(group + 4, stop)
+            Sort.__insertion_sort(items, group, group_stop + 1)
+
+            Sort.__swap(medians, (group + group_stop) // 2, items)
+            medians += 1
+
+        mid = (start + medians - 1) // 2
+        Sort.__quickselect(items, start, medians - 1, mid)
+
+        return mid
+
+    @staticmethod
+    def nsmallest(items: Iterable, k: int, key=None) -> list:
+        """Returns the k smallest items of an iterable in sorted order, 
+        consuming it once while keeping only k items in memory. Equal items 
+        keep their original order.<br>
+        The k smallest items seen so far are kept in a heap whose root is the
+        largest of them, and each new item smaller than the root replaces it.
+
+        Selection, stable
+
+        Time complexity: O(nlg(k))<br>
+        Memory space: Θ(k)
+
+        Args:
+            items (Iterable): The items to select from
+            k (int): The number of items to return
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+
+        Returns:
+            list: The k smallest items in ascending order
+        """
+        # Reversing the order keeps the largest of the k items at the root
+        entries = (
+            _Reversed((item if key is None else key(item), index, item))
+            for index, item in enumerate(items)
+        )
+
+        return [entry.value[-1] for entry in Sort.__bounded_heap(entries, k)]
+
+    @staticmethod
+    def nlargest(items: Iterable, k: int, key=None) -> list:
+        """Returns the k largest items of an iterable in sorted order, 
+        consuming it once while keeping only k items in memory. Equal items 
+        keep their original order.<br>
+        The k largest items seen so far are kept in a min heap, and each new
+        item larger than the root replaces it.
+
+        Selection, stable
+
+        Time complexity: O(nlg(k))<br>
+        Memory space: Θ(k)
+
+        Args:
+            items (Iterable): The items to select from
+            k (int): The number of items to return
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+
+        Returns:
+            list: The k largest items in descending order
+        """
+        entries = (
+            (item if key is None else key(item), -index, item)
+            for index, item in enumerate(items)
+        )
+
+        return [item for *_, item in Sort.__bounded_heap(entries, k)]
+
+    @staticmethod
+    def __bounded_heap(entries: Iterable, k: int) -> list:
+        """Returns the k largest entries in descending order, keeping them in 
+        a min heap of size k while the entries are consumed.
+
+        Time complexity: O(nlg(k))
+
+        Args:
+            entries (Iterable): The entries to select from
+            k (int): The number of entries to return
+
+        Returns:
+            list: The k largest entries in descending order
+        """
+        if k <= 0:
+            return []
+
+        entries = iter(entries)
+        heap = list(islice(entries, k))
+
+        size = len(heap)
+        Heap.build(heap, 0, size, Sort.__HEAP_ARITY)
+
+        for entry in entries:
+            if heap[0] < entry:
+                heap[0] = entry
+                Heap.sift_down(heap, 0, 0, size, Sort.__HEAP_ARITY)
+
+        Sort.__heapsort(heap, 0, size)
+        heap.reverse()
+
+        return heap
+
+    @staticmethod
+    def merge_sort(items: list, key=None, reverse: bool = False):
+        """Performs merge sort on a specified list. Modifies original list.<br>
+        Uses divide and conquer by continuously halfing the list into n sublists
+        before merging them together in sorted order. A single auxiliary list
+        is allocated up front and each level of recursion merges back and 
+        forth between it and the original list.
+
+        Comparision sort, not in-place, stable
+
+        Time complexity: Θ(nlg(n)) all cases<br>
+        Memory space: Θ(n)
+
+        Args:
+            items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.merge_sort, key, reverse):
+            return
+
+        buffer = items[:]
+        Sort.__merge_sort(buffer, items, 0, len(items))
+
+    @staticmethod
+    def __merge_sort(source: list, target: list, start: int, stop: int):
+        """Performs merge sort on a sublist, writing the sorted items into the
+        target list. Both lists must contain the same items in the sublist; 
+        the source list is used as scratch space.<br>
+        The halves are sorted into the source list so they can be merged into
+        the target list, alternating the roles of the lists at each level.
+
+        Time complexity: Θ(nlg(n)) all cases
+
+        Args:
+            source (list): The list to read the unsorted sublist from
+            target (list): The list to write the sorted sublist into
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist, exclusive
+        """
+        if stop - start < 2:
+            return
+
+        mid = (start + stop) // 2
+
+        Sort.__merge_sort(target, source, start, mid)
+        Sort.__merge_sort(target, source, mid, stop)
+        Sort.__merge(source, target, start, mid, stop)
+
+    @staticmethod
+    def bottom_up_merge_sort(items: list, key=None, reverse: bool = False):
+        """Performs bottom-up merge sort on a specified list. Modifies original
+        list.<br>
+        Merges adjacent sublists of width 1, 2, 4, ... without recursion,
+        alternating between the original list and a single auxiliary list.
+
+        Comparision sort, not in-place, stable
+
+        Time complexity: Θ(nlg(n)) all cases<br>
+        Memory space: Θ(n)
+
+        Args:
+            items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.bottom_up_merge_sort, key, reverse):
+            return
+
+        length = len(items)
+        source, target = items, items[:]
+
+        width = 1
+        while width < length:
+            for start in range(0, length, 2 * width):
+                mid = min(start + width, length)
+                stop = min(start + 2 * width, length)
+
+                Sort.__merge(source, target, start, mid, stop)
+
+            source, target = target, source
+            width *= 2
+
+        # Copies the result back if the last pass merged into the buffer
+        if source is not items:
+            items[:] = source
+
+    @staticmethod
+    def __merge(source: list, target: list, start: int, mid: int, stop: int):
+        """Merges two adjacent sorted sublists of the source list together in
+        sorted order into the same positions of the target list. Ties are 
+        taken from the left sublist to keep the merge stable.
+
+        Time complexity: Θ(n)
+
+        Args:
+            source (list): The list containing both sorted sublists
+            target (list): The list to write the merged items into
+            start (int): The start index of the left sublist
+            mid (int): The start index of the right sublist
+            stop (int): The stop index of the right sublist, exclusive
+        """
+        left, right = start, mid
+
+        for index in range(start, stop):
+            if left < mid and (right >= stop or source[right] >= source[left]):
+                target[index] = source[left]
+                left += 1
+
+            else:
+                target[index] = source[right]
+                right += 1
+
+    @staticmethod
+    def adaptive_merge_sort(items: list, key=None, reverse: bool = False):
+        """Performs adaptive natural merge sort on a specified list. Modifies
+        original list.<br>
+        Splits the list into naturally ascending or strictly descending runs,
+        extending short runs with binary insertion sort, and merges adjacent
+        runs kept on a stack whose lengths shrink at least like the Fibonacci
+        numbers. Merges gallop through long stretches taken from one run.
+
+        Comparision sort, not in-place, stable
+
+        Time complexity:
+        <li>Θ(nlg(n)) worst case</li>
+        <li>Θ(nlg(r)) for r runs</li>
+        <li>Θ(n) best case (already sorted or reversed)</li>
+
+        Memory space: Θ(n)
 
         Args:
             items (list): The list to sort
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
         """
-        max_item = abs(max(items, key=abs))
+        if Sort.__dispatch(items, Sort.adaptive_merge_sort, key, reverse):
+            return
+
+        length = len(items)
+        if length < 2:
+            return
+
+        min_run = Sort.__min_run(length)
+        buffer = [None] * (length // 2)
+        min_gallop = Sort.__MIN_GALLOP
+
+        runs = []
+        start = 0
+        while start < length:
+            run_length = Sort.__count_run(items, start, length)
+
+            # Extends short runs to the minimum run length
+            if run_length < min_run:
+                forced = min(min_run, length - start)
+                Sort.__binary_insertion_sort(
+                    items, start, start + run_length, start + forced
+                )
+                run_length = forced
+
+            runs.append([start, run_length])
+            min_gallop = Sort.__merge_collapse(items, runs, buffer, min_gallop)
+            start += run_length
+
+        # Merges all remaining runs
+        while len(runs) > 1:
+            index = len(runs) - 2
+            if index > 0 and runs[index - 1][1] < runs[index + 1][1]:
+                index -= 1
+
+            min_gallop = Sort.__merge_at(items, runs, index, buffer, min_gallop)
+
+    @staticmethod
+    def __min_run(length: int) -> int:
+        """Returns the minimum run length so that the number of runs is a power
+        of two or slightly less.
+
+        Args:
+            length (int): The length of the list
+
+        Returns:
+            int: The minimum run length, between 32 and 64 for long lists
+        """
+        remainder = 0
+        while length >= 64:
+            remainder |= length & 1
+            length >>= 1
+
+        return length + remainder
+
+    @staticmethod
+    def __count_run(items: list, start: int, stop: int) -> int:
+        """Returns the length of the run at the start of a sublist. A strictly
+        descending run is reversed in place so that it becomes ascending 
+        without breaking stability.
+
+        Time complexity: Θ(r) where r is the length of the run
+
+        Args:
+            items (list): The list containing the run
+            start (int): The start index of the run
+            stop (int): The stop index of the sublist
+
+        Returns:
+            int: The length of the run
+        """
+        end = start + 1
+        if end == stop:
+            return 1
+
+        if items[end] < items[start]:
+            while end < stop and items[end] < items[end - 1]:
+                end += 1
+
+            items[start:end] = reversed(items[start:end])
+
+        else:
+            while end < stop and not items[end] < items[end - 1]:
+                end += 1
+
+        return end - start
+
+    @staticmethod
+    def __binary_insertion_sort(items: list, start: int, mid: int, stop: int):
+        """Extends a sorted sublist by inserting each of the following items 
+        into it, using binary search to find where each item goes.
+
+        Time complexity:
+        <li>Θ(n^2) moves, Θ(nlg(n)) comparisons worst case</li>
+
+        Args:
+            items (list): The list containing the sublist
+            start (int): The start index of the sorted sublist
+            mid (int): The stop index of the sorted sublist
+            stop (int): The stop index of the items to insert
+        """
+        for index in range(mid, stop):
+            item = items[index]
+            position = bisect_right(items, item, start, index)
+
+            items[position + 1:index + 1] = items[position:index]
+            items[position] = item
+
+    @staticmethod
+    def __merge_collapse(
+        items: list, 
+        runs: list, 
+        buffer: list, 
+        min_gallop: int
+    ) -> int:
+        """Merges runs at the top of the stack until the lengths of the runs 
+        satisfy len(A) > len(B) + len(C) and len(B) > len(C) for every three
+        consecutive runs A, B, C.
+
+        Args:
+            items (list): The list containing the runs
+            runs (list): The stack of [start, length] runs
+            buffer (list): The scratch list for merging
+            min_gallop (int): The current galloping threshold
+
+        Returns:
+            int: The updated galloping threshold
+        """
+        while len(runs) > 1:
+            index = len(runs) - 2
+
+            if (
+                index > 0 
+                and runs[index - 1][1] <= runs[index][1] + runs[index + 1][1]
+            ) or (
+                index > 1 
+                and runs[index - 2][1] <= runs[index - 1][1] + runs[index][1]
+            ):
+                if runs[index - 1][1] < runs[index + 1][1]:
+                    index -= 1
+
+            elif runs[index][1] > runs[index + 1][1]:
+                break
+
+            min_gallop = Sort.__merge_at(items, runs, index, buffer, min_gallop)
+
+        return min_gallop
+
+    @staticmethod
+    def __merge_at(
+        items: list, 
+        runs: list, 
+        index: int, 
+        buffer: list, 
+        min_gallop: int
+    ) -> int:
+        """Merges the run at the index of the stack with the run after it. 
+        Items of the first run already smaller than the second run, and items
+        of the second run already larger than the first run, are left in 
+        place.
+
+        Args:
+            items (list): The list containing the runs
+            runs (list): The stack of [start, length] runs
+            index (int): The index of the first run in the stack
+            buffer (list): The scratch list for merging
+            min_gallop (int): The current galloping threshold
+
+        Returns:
+            int: The updated galloping threshold
+        """
+        start1, length1 = runs[index]
+        start2, length2 = runs[index + 1]
+
+        runs[index][1] = length1 + length2
+        del runs[index + 1]
+
+        # Skips the prefix of the first run that is not greater than the
+        # start of the second run
+        skipped = Sort.__gallop(
+            items[start2], items, start1, start2, True
+        ) - start1
+        start1 += skipped
+        length1 -= skipped
+        if not length1:
+            return min_gallop
+
+        # Skips the suffix of the second run that is not less than the end of
+        # the first run
+        length2 = Sort.__gallop(
+            items[start2 - 1], items, start2, start2 + length2, False, True
+        ) - start2
+        if not length2:
+            return min_gallop
+
+        if length1 <= length2:
+            return Sort.__merge_low(
+                items, start1, length1, start2, length2, buffer, min_gallop
+            )
+
+        return Sort.__merge_high(
+            items, start1, length1, start2, length2, buffer, min_gallop
+        )
+
+    @staticmethod
+    def __gallop(
+        key, 
+        items: list, 
+        start: int, 
+        stop: int, 
+        right: bool, 
+        from_end: bool = False
+    ) -> int:
+        """Finds where a key would be inserted into a sorted sublist by 
+        exponential search from one end followed by binary search, so keys 
+        that belong near that end are found in few comparisons.
+
+        Time complexity: O(lg(k)) where k is the distance from the end
+
+        Args:
+            key (Any): The key to search for
+            items (list): The list containing the sorted sublist
+            start (int): The start index of the sublist
+            stop (int): The stop index of the sublist
+            right (bool): Whether the key goes after items equal to it
+            from_end (bool, optional): Whether the search begins at the end of
+            the sublist instead of its start. Defaults to False.
+
+        Returns:
+            int: The index where the key would be inserted
+        """
+        bisect = bisect_right if right else bisect_left
+        low, high = start, stop
+
+        # Doubles the offset until the key is bracketed
+        offset = 1
+        if from_end:
+            while stop - offset >= start:
+                index = stop - offset
+                if key < items[index] or (not right and key == items[index]):
+                    high = index
+                    offset *= 2
+
+                else:
+                    low = index + 1
+                    break
+
+        else:
+            while start + offset - 1 < stop:
+                index = start + offset - 1
+                if key < items[index] or (not right and key == items[index]):
+                    high = index
+                    break
+
+                low = index + 1
+                offset *= 2
+
+        return bisect(items, key, low, high)
+
+    @staticmethod
+    def __merge_low(
+        items: list, 
+        start1: int, 
+        length1: int, 
+        start2: int, 
+        length2: int, 
+        buffer: list, 
+        min_gallop: int
+    ) -> int:
+        """Merges two adjacent runs from left to right by copying the shorter
+        first run into the buffer.
+
+        Args:
+            items (list): The list containing the runs
+            start1 (int): The start index of the first run
+            length1 (int): The length of the first run
+            start2 (int): The start index of the second run
+            length2 (int): The length of the second run
+            buffer (list): The scratch list, at least as long as the first run
+            min_gallop (int): The current galloping threshold
+
+        Returns:
+            int: The updated galloping threshold
+        """
+        buffer[:length1] = items[start1:start1 + length1]
+
+        left, left_stop = 0, length1
+        right, right_stop = start2, start2 + length2
+        index = start1
+
+        while left < left_stop and right < right_stop:
+            # Takes one item at a time until one run keeps winning
+            left_wins = right_wins = 0
+            while left < left_stop and right < right_stop:
+                if items[right] < buffer[left]:
+                    items[index] = items[right]
+                    right += 1
+                    right_wins += 1
+                    left_wins = 0
+
+                else:
+                    items[index] = buffer[left]
+                    left += 1
+                    left_wins += 1
+                    right_wins = 0
+
+                index += 1
+                if left_wins >= min_gallop or right_wins >= min_gallop:
+                    break
+
+            # Gallops while either run keeps winning by long stretches
+            while left < left_stop and right < right_stop:
+                found = Sort.__gallop(
+                    items[right], buffer, left, left_stop, True
+                )
+                left_wins = found - left
+                items[index:index + left_wins] = buffer[left:found]
+                index, left = index + left_wins, found
+                if left >= left_stop:
+                    break
+
+                found = Sort.__gallop(
+                    buffer[left], items, right, right_stop, False
+                )
+                right_wins = found - right
+                items[index:index + right_wins] = items[right:found]
+                index, right = index + right_wins, found
+
+                if (
+                    left_wins < Sort.__MIN_GALLOP 
+                    and right_wins < Sort.__MIN_GALLOP
+                ):
+                    min_gallop += 1
+                    break
+
+                min_gallop = max(min_gallop - 1, 1)
+
+        # The rest of the second run is already in place
+        items[index:index + left_stop - left] = buffer[left:left_stop]
+        return min_gallop
+
+    @staticmethod
+    def __merge_high(
+        items: list, 
+        start1: int, 
+        length1: int, 
+        start2: int, 
+        length2: int, 
+        buffer: list, 
+        min_gallop: int
+    ) -> int:
+        """Merges two adjacent runs from right to left by copying the shorter
+        second run into the buffer.
+
+        Args:
+            items (list): The list containing the runs
+            start1 (int): The start index of the first run
+            length1 (int): The length of the first run
+            start2 (int): The start index of the second run
+            length2 (int): The length of the second run
+            buffer (list): The scratch list, at least as long as the second run
+            min_gallop (int): The current galloping threshold
+
+        Returns:
+            int: The updated galloping threshold
+        """
+        buffer[:length2] = items[start2:start2 + length2]
+
+        # Indices point one past the next item to take from each run
+        left, left_start = start1 + length1, start1
+        right = length2
+        index = start2 + length2
+
+        while left > left_start and right > 0:
+            # Takes one item at a time until one run keeps winning
+            left_wins = right_wins = 0
+            while left > left_start and right > 0:
+                index -= 1
+                if buffer[right - 1] < items[left - 1]:
+                    items[index] = items[left - 1]
+                    left -= 1
+                    left_wins += 1
+                    right_wins = 0
+
+                else:
+                    items[index] = buffer[right - 1]
+                    right -= 1
+                    right_wins += 1
+                    left_wins = 0
+
+                if left_wins >= min_gallop or right_wins >= min_gallop:
+                    break
+
+            # Gallops while either run keeps winning by long stretches
+            while left > left_start and right > 0:
+                found = Sort.__gallop(
+                    buffer[right - 1], items, left_start, left, True, True
+                )
+                left_wins = left - found
+                items[index - left_wins:index] = items[found:left]
+                index, left = index - left_wins, found
+                if left <= left_start:
+                    break
+
+                found = Sort.__gallop(
+                    items[left - 1], buffer, 0, right, False, True
+                )
+                right_wins = right - found
+                items[index - right_wins:index] = buffer[found:right]
+                index, right = index - right_wins, found
+
+                if (
+                    left_wins < Sort.__MIN_GALLOP 
+                    and right_wins < Sort.__MIN_GALLOP
+                ):
+                    min_gallop += 1
+                    break
+
+                min_gallop = max(min_gallop - 1, 1)
+
+        # The rest of the first run is already in place
+        items[index - right:index] = buffer[:right]
+        return min_gallop
+
+    @staticmethod
+    def counting_sort(items: list, key=None, reverse: bool = False):
+        """Performs counting sort on a specified list of integers. Modifies 
+        original list.<br>
+        Counts how many times each value occurs between the minimum and the 
+        maximum value, turns the counts into starting positions, and copies
+        each item to the next free position of its value.
+
+        Linear sort, not in-place, stable
+
+        Time complexity: Θ(n + k) all cases where k is the range of item values
+        <br>
+        Memory space: Θ(n + k)
+
+        Args:
+            items (list): The list to sort
+            key (function, optional): The function returning the integer key of
+            an item; None to sort the integers themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.counting_sort, key, reverse):
+            return
+
+        if len(items) < 2:
+            return
+
+        keys = items if key is None else [key(item) for item in items]
+        low, high = min(keys), max(keys)
+
+        counts = [0] * (high - low + 1)
+        for item_key in keys:
+            counts[item_key - low] += 1
+
+        # Converts counts into the starting position of each value
+        position = 0
+        for value, count in enumerate(counts):
+            counts[value] = position
+            position += count
+
+        output = [None] * len(items)
+        for item, item_key in zip(items, keys):
+            output[counts[item_key - low]] = item
+            counts[item_key - low] += 1
+
+        items[:] = output
+
+    @staticmethod
+    def radix_sort(items: list, key=None, reverse: bool = False):
+        """Performs radix sort on a specified list of integers. Modifies
+        original list.<br>
+        Sorts the keys by their least significant byte to their most 
+        significant byte with a stable counting pass per byte. Keys are offset
+        by the minimum key so negative integers sort correctly. Each pass moves
+        items and keys back and forth between the original lists and one pair
+        of buffers, and passes where every key has the same byte are skipped.
+
+        Linear sort, not in-place, stable
+
+        Time complexity: Θ(d(n + b)) where d is the number of bytes in the 
+        range of the keys and b = 256<br>
+        Memory space: Θ(n + b)
+
+        Args:
+            items (list): The list to sort
+            key (function, optional): The function returning the integer key of
+            an item; None to sort the integers themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if Sort.__dispatch(items, Sort.radix_sort, key, reverse):
+            return
+
+        length = len(items)
+        if length < 2:
+            return
+
+        keys = list(items) if key is None else [key(item) for item in items]
+
+        low = min(keys)
+        if low:
+            keys = [item_key - low for item_key in keys]
+
+        high = max(keys)
+
+        source_items, source_keys = items, keys
+        target_items, target_keys = [None] * length, [0] * length
+
+        shift = 0
+        while high >> shift:
+            counts = [0] * 256
+            for item_key in source_keys:
+                counts[item_key >> shift & 255] += 1
+
+            # Every key shares this byte, so the pass would not move anything
+            if length in counts:
+                shift += 8
+                continue
+
+            position = 0
+            for digit, count in enumerate(counts):
+                counts[digit] = position
+                position += count
+
+            for item, item_key in zip(source_items, source_keys):
+                digit = item_key >> shift & 255
+                target_items[counts[digit]] = item
+                target_keys[counts[digit]] = item_key
+                counts[digit] += 1
+
+            source_items, target_items = target_items, source_items
+            source_keys, target_keys = target_keys, source_keys
+            shift += 8
+
+        # Copies the result back if the last pass wrote into the buffer
+        if source_items is not items:
+            items[:] = source_items
+
+    @staticmethod
+    def parallel_sort(
+        items: list, 
+        workers: int = None, 
+        method=None, 
+        key=None, 
+        reverse: bool = False
+    ):
+        """Performs parallel merge sort on a specified list. Modifies original
+        list.<br>
+        Splits the list into one chunk per worker, sorts every chunk in its own
+        process with the specified method, and merges the sorted chunks. 
+        Chunks of numeric buffers are shared with the workers through shared
+        memory instead of being pickled, and are merged pairwise with 
+        vectorized operations when NumPy is installed; other chunks are merged
+        at once with a k-way heap merge. With a key or in reverse, the keys
+        are computed in this process and paired with their indices, and the
+        pairs are sorted by the workers with the method.
+
+        Comparision sort, not in-place, stable if the method is stable
+
+        Time complexity: Θ((n/p)lg(n/p) + nlg(p)) for p workers<br>
+        Memory space: Θ(n)
+
+        Args:
+            items (list): The list to sort
+            workers (int, optional): The number of processes; None for the 
+            number of CPUs. Defaults to None.
+            method (function, optional): The sorting method used on each chunk;
+            None for adaptive merge sort. Defaults to None.
+            key (function, optional): The function returning the key to sort
+            an item by; None to compare the items themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order, 
+            keeping equal items in their original order. Defaults to False.
+        """
+        if key is not None or reverse:
+            Sort.__sort_keyed(
+                items, 
+                partial(Sort.parallel_sort, workers=workers, method=method), 
+                key, 
+                reverse, 
+                fast=False
+            )
+            return
+
+        workers = workers if workers else os.cpu_count()
+        method = method if method else Sort.adaptive_merge_sort
+
+        length = len(items)
+        if workers < 2 or length < 2 * workers:
+            method(items)
+            return
+
+        bounds = [
+            (length * i // workers, length * (i + 1) // workers) 
+            for i in range(workers)
+        ]
+
+        if isinstance(items, array):
+            typecode = items.typecode
+            shared = typecode in Sort.__NUMERIC_TYPECODES
+
+        elif np is not None and isinstance(items, np.ndarray):
+            typecode = items.dtype.char
+            shared = (
+                items.ndim == 1 
+                and typecode in Sort.__NUMERIC_TYPECODES 
+                and items.dtype.isnative
+            )
+
+        else:
+            shared = False
+
+        if shared and not isinstance(items, array) and (
+            not items.flags.c_contiguous
+        ):
+            # Strided views cannot be copied into shared memory byte by byte,
+            # so a contiguous copy is sorted and written back instead
+            contiguous = np.ascontiguousarray(items)
+            Sort.__parallel_sort_shared(contiguous, typecode, bounds, method)
+            items[:] = contiguous
+            return
+
+        if shared:
+            Sort.__parallel_sort_shared(items, typecode, bounds, method)
+            return
+
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = list(pool.map(
+                _sort_chunk, 
+                repeat(method), 
+                (items[start:stop] for start, stop in bounds)
+            ))
+
+        Sort.__write_back(items, list(merge(*chunks)))
+
+    @staticmethod
+    def __parallel_sort_shared(items, typecode: str, bounds: list, method):
+        """Sorts the chunks of a numeric buffer in worker processes that attach
+        to a shared copy of the buffer, then merges the chunks back into the
+        buffer.
+
+        Args:
+            items (Any): The array.array or NumPy array to sort
+            typecode (str): The struct format character of the items
+            bounds (list): The (start, stop) indices of every chunk
+            method (function): The sorting method used on each chunk
+        """
+        source = memoryview(items).cast('B')
+        memory = SharedMemory(create=True, size=max(source.nbytes, 1))
+
+        try:
+            memory.buf[:source.nbytes] = source
+            source.release()
+
+            with ProcessPoolExecutor(len(bounds)) as pool:
+                list(pool.map(
+                    _sort_shared_chunk,
+                    repeat(memory.name),
+                    repeat(typecode),
+                    repeat(method),
+                    *zip(*bounds)
+                ))
+
+            view = memory.buf[:len(items) * items.itemsize].cast(typecode)
+            try:
+                if np is not None:
+                    sorted_view = np.frombuffer(view, dtype=typecode)
+                    chunks = [sorted_view[start:stop] for start, stop in bounds]
+
+                    # Merges neighbouring chunks until one remains
+                    while len(chunks) > 1:
+                        chunks = [
+                            Sort.__numpy_merge(*chunks[i:i + 2]) 
+                            if i + 1 < len(chunks) else chunks[i]
+                            for i in range(0, len(chunks), 2)
+                        ]
+
+                    Sort.numeric_view(items)[:] = chunks[0]
+
+                    del sorted_view, chunks
+
+                else:
+                    Sort.__write_back(items, list(merge(
+                        *(view[start:stop] for start, stop in bounds)
+                    )))
+
+            finally:
+                view.release()
+
+        finally:
+            memory.close()
+            memory.unlink()
+
+    @staticmethod
+    def __numpy_merge(left, right):
+        """Merges two sorted NumPy arrays. The position of every item in the
+        merged array is its own index plus the number of items of the other
+        array that go before it, found with a vectorized binary search. Ties
+        are taken from the left array to keep the merge stable.
+
+        Time complexity: Θ(nlg(n)) comparisons, vectorized
+
+        Args:
+            left (np.ndarray): The first sorted array
+            right (np.ndarray): The second sorted array
+
+        Returns:
+            np.ndarray: The merged array
+        """
+        merged = np.empty(len(left) + len(right), dtype=left.dtype)
+        merged[
+            np.arange(len(left)) + np.searchsorted(right, left, side='left')
+        ] = left
+        merged[
+            np.arange(len(right)) + np.searchsorted(left, right, side='right')
+        ] = right
+
+        return merged
+
+
+    @staticmethod
+    def external_sort(
+        input_path: str, 
+        output_path: str, 
+        memory_limit: int = 1 << 26, 
+        key=None, 
+        reverse: bool = False, 
+        method=None, 
+        encoding: str = 'utf-8'
+    ):
+        """Performs external merge sort on the lines of a file that may be 
+        larger than memory, writing the sorted lines into another file. Every
+        line of the output ends with a newline.
+
+        Comparision sort, not in-place, stable if the method is stable
+
+        Time complexity: Θ(nlg(n))<br>
+        Memory space: Θ(m) where m is the memory limit
+
+        Args:
+            input_path (str): The path of the file to sort
+            output_path (str): The path of the sorted file
+            memory_limit (int, optional): The approximate number of bytes of 
+            lines held in memory at once. Defaults to 64 MiB.
+            key (function, optional): The function returning the key of a 
+            line; None to compare the lines themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order.
+            Defaults to False.
+            method (function, optional): The sorting method used on each run;
+            None for adaptive merge sort. Defaults to None.
+            encoding (str, optional): The encoding of both files. Defaults to
+            'utf-8'.
+        """
+        lines = Sort.iter_external_sort(
+            input_path, memory_limit, key, reverse, method, encoding
+        )
+
+        with open(output_path, 'w', encoding=encoding, newline='') as output:
+            output.writelines(lines)
+
+    @staticmethod
+    def iter_external_sort(
+        input_path: str, 
+        memory_limit: int = 1 << 26, 
+        key=None, 
+        reverse: bool = False, 
+        method=None, 
+        encoding: str = 'utf-8', 
+        fan_in: int = 64
+    ) -> Iterable:
+        """Returns an iterator of the lines of a file that may be larger than
+        memory in sorted order.<br>
+        Streams the file into runs that fit in the memory limit, sorts each run
+        with the specified method and spills it to a temporary file, then 
+        merges the runs with a k-way heap merge over buffered reads. If there
+        are more runs than the fan-in, groups of runs are merged into longer
+        runs first so that only a bounded number of files are open at once. 
+        Temporary files are removed once the iterator is exhausted or closed.
+
+        Time complexity: Θ(nlg(n))<br>
+        Memory space: Θ(m) where m is the memory limit
+
+        Args:
+            input_path (str): The path of the file to sort
+            memory_limit (int, optional): The approximate number of bytes of 
+            lines held in memory at once. Defaults to 64 MiB.
+            key (function, optional): The function returning the key of a 
+            line; None to compare the lines themselves. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order.
+            Defaults to False.
+            method (function, optional): The sorting method used on each run;
+            None for adaptive merge sort. Defaults to None.
+            encoding (str, optional): The encoding of the file. Defaults to
+            'utf-8'.
+            fan_in (int, optional): The largest number of runs merged at once.
+            Defaults to 64.
+
+        Raises:
+            ValueError: The fan-in is less than 2
+
+        Returns:
+            Iterable: The iterator of all lines in sorted order, each ending 
+            with a newline
+        """
+        # Merging fewer than two runs at once would never reduce their number
+        if fan_in < 2:
+            raise ValueError('fan_in must be at least 2')
+
+        return Sort.__iter_external_sort(
+            input_path, 
+            memory_limit, 
+            key, 
+            reverse, 
+            method if method else Sort.adaptive_merge_sort, 
+            encoding, 
+            fan_in
+        )
+
+    @staticmethod
+    def __iter_external_sort(
+        input_path: str, 
+        memory_limit: int, 
+        key, 
+        reverse: bool, 
+        method, 
+        encoding: str, 
+        fan_in: int
+    ) -> Iterable:
+        """Yields the lines of a file in sorted order for 
+        Sort.iter_external_sort, which validates the arguments before the
+        file is read.
+
+        Args:
+            input_path (str): The path of the file to sort
+            memory_limit (int): The approximate number of bytes of lines held
+            in memory at once
+            key (function): The function returning the key of a line; None to
+            compare the lines themselves
+            reverse (bool): Whether to sort in descending order
+            method (function): The sorting method used on each run
+            encoding (str): The encoding of the file
+            fan_in (int): The largest number of runs merged at once
+
+        Yields:
+            str: The next line in sorted order, ending with a newline
+        """
+        with TemporaryDirectory() as directory:
+            paths = Sort.__spill_runs(
+                input_path, directory, memory_limit, key, reverse, method, 
+                encoding
+            )
+
+            # Merges groups of runs until they can all be merged at once
+            while len(paths) > fan_in:
+                merged_paths = []
+                for start in range(0, len(paths), fan_in):
+                    merged_path = os.path.join(
+                        directory, f'run{len(paths)}-{start}.txt'
+                    )
+
+                    with open(
+                        merged_path, 'w', encoding=encoding, newline=''
+                    ) as run:
+                        run.writelines(Sort.__merge_runs(
+                            paths[start:start + fan_in], key, reverse, encoding
+                        ))
+
+                    merged_paths.append(merged_path)
+
+                for path in paths:
+                    os.remove(path)
+
+                paths = merged_paths
+
+            yield from Sort.__merge_runs(paths, key, reverse, encoding)
+
+    @staticmethod
+    def __spill_runs(
+        input_path: str, 
+        directory: str, 
+        memory_limit: int, 
+        key, 
+        reverse: bool, 
+        method, 
+        encoding: str
+    ) -> list:
+        """Splits a file into sorted runs that each fit in the memory limit and
+        writes every run into its own file.
+
+        Args:
+            input_path (str): The path of the file to sort
+            directory (str): The directory of the run files
+            memory_limit (int): The approximate number of bytes of lines held
+            in memory at once
+            key (function): The function returning the key of a line; None to
+            compare the lines themselves
+            reverse (bool): Whether to sort in descending order
+            method (function): The sorting method used on each run
+            encoding (str): The encoding of the file
+
+        Returns:
+            list: The paths of the run files in order
+        """
+        paths = []
+
+        def spill(lines):
+            method(lines, key=key, reverse=reverse)
+
+            path = os.path.join(directory, f'run{len(paths)}.txt')
+            with open(path, 'w', encoding=encoding, newline='') as run:
+                run.writelines(lines)
+
+            paths.append(path)
+
+        with open(input_path, encoding=encoding, newline='') as file:
+            lines, size = [], 0
+            for line in file:
+                if not line.endswith('\n'):
+                    line += '\n'
+
+                lines.append(line)
+                size += sys.getsizeof(line) + 8
+
+                if size >= memory_limit:
+                    spill(lines)
+                    lines, size = [], 0
+
+            if lines:
+                spill(lines)
+
+        return paths
+
+    @staticmethod
+    def __merge_runs(
+        paths: list, 
+        key, 
+        reverse: bool, 
+        encoding: str
+    ) -> Iterable:
+        """Merges sorted run files with a k-way heap merge, keeping only one
+        buffered line of every run in memory.
+
+        Args:
+            paths (list): The paths of the run files in order
+            key (function): The function returning the key of a line; None to
+            compare the lines themselves
+            reverse (bool): Whether the runs are in descending order
+            encoding (str): The encoding of the run files
+
+        Returns:
+            Iterable: The iterator of all lines of the runs in sorted order
+        """
+        with ExitStack() as stack:
+            runs = [
+                stack.enter_context(open(
+                    path, encoding=encoding, newline='', buffering=1 << 16
+                ))
+                for path in paths
+            ]
+
+            yield from merge(*runs, key=key, reverse=reverse)
+
+    @staticmethod
+    @contextmanager
+    def instrument(stats: dict = None) -> Iterable:
+        """Counts the work done by the Sort and Tree methods called inside the
+        context. Nothing is hooked outside the context, so the methods cost
+        nothing extra when they are not instrumented.<br>
+        Swaps are counted on every call to Sort.__swap and the recursion depth
+        is the deepest nesting of Sort and Tree method calls. The peak memory 
+        is the largest number of bytes allocated at once, traced with 
+        tracemalloc. Comparisons and moves are only counted by Sort.measure.
+
+        Args:
+            stats (dict, optional): The counters to add to, with every counter
+            present; None to start from zero. Defaults to None.
+
+        Yields:
+            dict: The counters, updated until the context exits
+        """
+        if stats is None:
+            stats = dict.fromkeys(Sort.__COUNTERS, 0)
+
+        depth = 0
+
+        # The frame of this generator returns when it yields and is resumed
+        # when the context exits, neither of which is a nested call
+        own_code = Sort.instrument.__wrapped__.__code__
+
+        def profile(frame, event, arg):
+            nonlocal depth
+            if event != 'call' and event != 'return' or (
+                frame.f_code is own_code
+            ):
+                return
+
+            name = frame.f_code.co_qualname
+            if not name.startswith(('Sort.', 'Tree.')):
+                return
+
+            if event == 'return':
+                depth -= 1
+                return
+
+            depth += 1
+            stats['recursion_depth'] = max(stats['recursion_depth'], depth)
+            if name == 'Sort.__swap':
+                stats['swaps'] += 1
+
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        previous = sys.getprofile()
+        sys.setprofile(profile)
+        try:
+            yield stats
+
+        finally:
+            sys.setprofile(previous)
+            stats['peak_memory'] = tracemalloc.get_traced_memory()[1] - baseline
+
+            if not tracing:
+                tracemalloc.stop()
+
+    @staticmethod
+    def measure(method, items: list, *args, **kwargs) -> dict:
+        """Calls a sorting method on the items inside Sort.instrument and
+        returns its counters. Each item of a list is wrapped to count the
+        comparisons between items, and the list is replaced by a copy that 
+        counts every item written into it or into its slices. The sorted items
+        are written back into the original list afterwards.<br>
+        Items sorted by counting or radix sort are not wrapped since they are
+        never compared, and buffers are sorted as they are. Sort.sort is
+        measured as the engine it chooses for the unwrapped items, without its
+        profiling pass.
+
+        Args:
+            method (function): The sorting method to call
+            items (list): The list to sort
+            *args: The positional arguments passed to the method
+            **kwargs: The keyword arguments passed to the method
+
+        Returns:
+            dict: The number of comparisons, swaps and moves, the peak memory
+            in bytes and the recursion depth of the call
+        """
+        stats = dict.fromkeys(Sort.__COUNTERS, 0)
+        if not isinstance(items, list):
+            with Sort.instrument(stats):
+                method(items, *args, **kwargs)
+
+            return stats
+
+        # Wrapped items would hide their types from the profile, so the engine
+        # is chosen from the items themselves
+        if method is Sort.sort and not args and (
+            kwargs.get('key') is None and not kwargs.get('reverse')
+        ):
+            if len(items) < 2:
+                return stats
+
+            method = Sort.__choose_engine(items)
+            if method is None:
+                return stats
+
+        counted = method not in (Sort.counting_sort, Sort.radix_sort)
+        if counted:
+            tracked = _TrackedList(
+                (_Counted(item, stats) for item in items), stats
+            )
+
+            if (key := kwargs.get('key')) is not None:
+                kwargs['key'] = lambda item: key(item.value)
+
+        else:
+            tracked = _TrackedList(items, stats)
+
+        with Sort.instrument(stats):
+            method(tracked, *args, **kwargs)
+
+        items[:] = [item.value for item in tracked] if counted else tracked
+        return stats
+
+
+def _sort_chunk(method, chunk: list) -> list:
+    """Sorts a chunk of a list inside a worker process of Sort.parallel_sort.
+
+    Args:
+        method (function): The sorting method
+        chunk (list): The chunk to sort
+
+    Returns:
+        list: The sorted chunk
+    """
+    method(chunk)
+    return chunk
+
+
+def _sort_shared_chunk(
+    name: str, 
+    typecode: str, 
+    method, 
+    start: int, 
+    stop: int
+):
+    """Sorts a chunk of a shared numeric buffer in place inside a worker 
+    process of Sort.parallel_sort.
+
+    Args:
+        name (str): The name of the shared memory block
+        typecode (str): The struct format character of the items
+        method (function): The sorting method
+        start (int): The start index of the chunk
+        stop (int): The stop index of the chunk, exclusive
+    """
+    memory = SharedMemory(name=name)
+    view = memory.buf.cast(typecode)
+    try:
+        chunk = view[start:stop]
+        if np is not None:
+            method(np.frombuffer(chunk, dtype=typecode))
+
+        else:
+            values = array(typecode, chunk.tobytes())
+            method(values)
+            chunk[:] = memoryview(values)
+
+        chunk.release()
+
+    finally:
+        view.release()
+        memory.close()
+
+
+class _Reversed:
+    """An item that compares in reverse order for the heap of Sort.nsmallest."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+
+class _Counted:
+    """An item that counts its comparisons for Sort.measure."""
+    __slots__ = ('value', 'stats')
+
+    def __init__(self, value, stats: dict):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        self.stats['comparisons'] += 1
+        return self.value != other.value
+
+
+class _TrackedList(list):
+    """A list that counts the items written into it for Sort.measure. Its 
+    slices are tracked lists sharing the same counters.
+    """
+
+    def __init__(self, items: Iterable, stats: dict):
+        super().__init__(items)
+        self.stats = stats
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _TrackedList(super().__getitem__(index), self.stats)
+
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.stats['moves'] += len(value)
+
+        else:
+            self.stats['moves'] += 1
 
-        radix = 1
-        while radix < max_item:
-            pass
+        super().__setitem__(index, value)